@@ -19,8 +19,10 @@ class Catalog:
         """
         Query the DB and return a clean dictionary of metadata.
         """
-        query = TapeMetadata.select()
-        stats = {m.key: m.value for m in query}
+        # tuples() skips model hydration: two raw columns into a dict.
+        stats = dict(
+            TapeMetadata.select(TapeMetadata.key, TapeMetadata.value).tuples()
+        )
         return {
             "fingerprint": stats.get("fingerprint", ""),
             "total_size": int(stats.get("total_size", 0)),
@@ -44,14 +46,27 @@ class Catalog:
         except Track.DoesNotExist:  # type: ignore
             raise InvalidOffsetError(f"No track found at absolute offset {absolute_offset}")
 
-    def query_tracks_intersecting_range(self, start_offset: int) -> Iterable[Track]:
+    def query_tracks_intersecting_range(
+        self, start_offset: int, include_header_blocks: bool = True
+    ) -> Iterable[Track]:
         """
         Queries the database for tracks that exist from this point forward.
         Returns raw Track objects (Static Data).
+
+        With include_header_blocks=False the 512-byte header_block blob
+        is left out of the projection (the attribute reads back None), so
+        callers that materialize one entry per track don't also hold one
+        header per track — the stream rebuilds missing headers on demand.
         """
+        if include_header_blocks:
+            query = Track.select()
+        else:
+            columns = [
+                f for f in Track._meta.sorted_fields if f is not Track.header_block
+            ]
+            query = Track.select(*columns)
         return (
-            Track.select()
-            .where(Track.end_offset > start_offset)
+            query.where(Track.end_offset > start_offset)
             .order_by(Track.arc_path)
             .iterator()
         )
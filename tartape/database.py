@@ -19,8 +19,17 @@ class DatabaseSession:
                 "cache_size": -1024 * 64,  # 64MB cache
                 "foreign_keys": 1,
                 "synchronous": "NORMAL",
+                # Spill temp B-trees (ORDER BY, GROUP BY) to RAM instead
+                # of temp files, and let SQLite mmap up to 256MB of the
+                # DB so reads come straight from the page cache.
+                "temp_store": "MEMORY",
+                "mmap_size": 268435456,
             },
             timeout=10,
+            # Allow handing the connection to a dedicated worker thread
+            # (e.g. the recorder's DB writer). Callers are responsible for
+            # never using it from two threads at once.
+            check_same_thread=False,
         )
         from tartape.models import TapeMetadata, Track
 
@@ -28,12 +37,40 @@ class DatabaseSession:
         # 'bind' Ignore what your Meta.database (the proxy) says and use ME directly
         self.db.bind(self._models, bind_refs=True, bind_backrefs=True)
 
+    # Columns added to Track after the first release, with their SQLite
+    # type. create_tables(safe=True) never ALTERs an existing table, so
+    # catalogs recorded before a column existed must get it bolted on at
+    # connect time or every SELECT against them fails outright.
+    _TRACK_UPGRADES = (
+        ("mtime_ns", "INTEGER"),
+        ("header_block", "BLOB"),
+    )
+
     def __enter__(self):
         if self.db.is_closed():
             self.db.connect()
         self.db.create_tables(self._models, safe=True)
+        self._upgrade_schema()
         return self.db
 
+    def _upgrade_schema(self):
+        """Adds late columns to catalogs recorded before they existed.
+
+        All upgrade columns are nullable, so ADD COLUMN is a pure
+        metadata change in SQLite — no table rewrite, no data touched.
+        Rows from old catalogs read back NULL, which the consumers
+        already treat as "not recorded" (e.g. the seconds fallback in
+        validate_integrity).
+        """
+        existing = {
+            row[1] for row in self.db.execute_sql("PRAGMA table_info('track')")
+        }
+        for column, sql_type in self._TRACK_UPGRADES:
+            if column not in existing:
+                self.db.execute_sql(
+                    f"ALTER TABLE track ADD COLUMN {column} {sql_type}"
+                )
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         if not self.db.is_closed():
             self.db.close()
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import logging
 import os
@@ -56,6 +57,30 @@ def truncate_component_safe(component: str, max_bytes: int = 100) -> str:
 
     return result
 
+
+@functools.lru_cache(maxsize=8192)
+def _resolve_component(component: str, auto_truncate: bool) -> str:
+    """
+    Validates (or truncates) a single path component against the 100-byte
+    ADR-005 limit. Memoized: directory components repeat for every entry
+    beneath them, so most calls during discovery are cache hits.
+    """
+    resolved = component
+    if len(component.encode("utf-8")) > 100:
+        if auto_truncate is True:
+            resolved = truncate_component_safe(component, 100)
+        else:
+            raise PathConstraintError(f"Component too long: {component}")
+
+    # No component should EVER leave this method exceeding 100 bytes if we are in this engine.
+    if len(resolved.encode("utf-8")) > 100:
+        raise PathConstraintError(
+            f"Critical failure: Component '{resolved}' still exceeds 100 bytes "
+            "after resolution logic."
+        )
+    return resolved
+
+
 class TarEntryFactory:
     """
     Exclusively responsible for inspecting the file system
@@ -73,24 +98,10 @@ class TarEntryFactory:
         Validates ADR-005 constraints or truncates if auto_truncate is True.
         Returns the final valid archive path (arcname).
         """
-        components = arcname.split("/")
-        final_components = []
-
-        for component in components:
-            resolved = component
-            if len(component.encode("utf-8")) > 100:
-                if auto_truncate is True:
-                    resolved = truncate_component_safe(component, 100)
-                else:
-                    raise PathConstraintError(f"Component too long: {component}")
-
-            # No component should EVER leave this method exceeding 100 bytes if we are in this engine.
-            if len(resolved.encode("utf-8")) > 100:
-                raise PathConstraintError(
-                    f"Critical failure: Component '{resolved}' still exceeds 100 bytes "
-                    "after resolution logic."
-                )
-            final_components.append(resolved)
+        final_components = [
+            _resolve_component(component, auto_truncate)
+            for component in arcname.split("/")
+        ]
 
         final_path = "/".join(final_components)
         if len(final_path.encode("utf-8")) > 255:
@@ -132,13 +143,22 @@ class TarEntryFactory:
         return hash_md5.hexdigest()
 
     @staticmethod
-    def inspect(path: Path, precomputed_stat: Optional[os.stat_result] = None) -> DiskEntryStats:
+    def inspect(
+        path: Union[str, Path],
+        precomputed_stat: Optional[os.stat_result] = None,
+        resolve_owner: bool = True,
+    ) -> DiskEntryStats:
         """
         Performs low-level lstat on the path, or uses a precomputed stat result
         (e.g., from os.scandir) to avoid redundant syscalls.
+
+        Accepts plain strings as well as Path objects so hot callers can
+        skip Path construction entirely. resolve_owner=False skips the
+        pwd/grp name lookups for callers that only compare size/mtime
+        (e.g. the per-entry integrity check).
         """
         try:
-            st = precomputed_stat if precomputed_stat else path.lstat()
+            st = precomputed_stat if precomputed_stat else os.lstat(path)
 
             # Extract only the permission bits (0o755, 0o644, etc.)
             permissions = stat_module.S_IMODE(st.st_mode)
@@ -150,21 +170,23 @@ class TarEntryFactory:
 
             # Securely extract usernames/group names
             uname, gname = "", ""
-            if pwd:
-                try:
-                    uname = pwd.getpwuid(st.st_uid).pw_name  # type: ignore
-                except (KeyError, AttributeError):
-                    uname = str(st.st_uid)
-            if grp:
-                try:
-                    gname = grp.getgrgid(st.st_gid).gr_name  # type: ignore
-                except (KeyError, AttributeError):
-                    gname = str(st.st_gid)
+            if resolve_owner:
+                if pwd:
+                    try:
+                        uname = pwd.getpwuid(st.st_uid).pw_name  # type: ignore
+                    except (KeyError, AttributeError):
+                        uname = str(st.st_uid)
+                if grp:
+                    try:
+                        gname = grp.getgrgid(st.st_gid).gr_name  # type: ignore
+                    except (KeyError, AttributeError):
+                        gname = str(st.st_gid)
 
             return DiskEntryStats(
                 exists=True,
                 size=st.st_size if not is_dir else 0,
                 mtime=int(st.st_mtime),
+                mtime_ns=st.st_mtime_ns,
                 mode=permissions,
                 uid=st.st_uid,
                 gid=st.st_gid,
@@ -203,8 +225,9 @@ class TarEntryFactory:
         if not stats.exists or not (stats.is_dir or stats.is_file or stats.is_symlink):
             return None
 
-        # Determine link target for symlinks
-        linkname = os.readlink(path) if stats.is_symlink else ""
+        # Link target for symlinks was already resolved by inspect();
+        # a second readlink here would just repeat the syscall.
+        linkname = stats.linkname
 
         # Directories and symlinks have 0 size in TAR headers
         effective_size = 0 if (stats.is_dir or stats.is_symlink) else stats.size
@@ -239,6 +262,7 @@ class TarEntryFactory:
             is_symlink=stats.is_symlink,
             linkname=linkname,
             md5sum=md5_value,
+            mtime_ns=stats.mtime_ns,
         )
     @staticmethod
     def normalize_mode(stats: DiskEntryStats, anonymize: bool) -> int:
@@ -268,35 +292,49 @@ class TarEntryFactory:
         return 0o755 if is_executable else 0o644
 
 def validate_integrity(
-    expected: EntryMetadata | Track, tape_root_directory: Path
+    expected: EntryMetadata | Track, tape_root_directory: Union[str, Path]
 ) -> None:
     """
     Strict implementation of ADR-002.
     Compares the expected pure metadata against the current physical disk state.
     Raises TarIntegrityError if any discrepancy is found.
     """
-    full_disk_path = Path(tape_root_directory) / expected.rel_path
-    stats = TarEntryFactory.inspect(full_disk_path)
+    # Plain string join: this runs once per entry on the streaming hot
+    # path, where Path construction is measurable.
+    full_disk_path = os.path.join(os.fspath(tape_root_directory), expected.rel_path)
+    # Owner names never enter the comparison below, so skip the pwd/grp
+    # lookups — this check runs once per entry on the streaming path.
+    stats = TarEntryFactory.inspect(full_disk_path, resolve_owner=False)
 
     if not stats.exists:
         raise TarIntegrityError(f"File missing: {expected.arc_path}")
 
+    # Exact integer nanosecond compare when the catalog recorded it;
+    # older catalogs only carry seconds, so fall back to those.
+    expected_ns = expected.mtime_ns
+    if expected_ns is not None:
+        mtime_changed = stats.mtime_ns != expected_ns
+    else:
+        mtime_changed = stats.mtime != expected.mtime
+
     # ADR-002: Directory structural integrity
     if expected.is_dir:
         if expected.rel_path in ("", "."):
             return  # Root directory mtime is ignored
-        if stats.mtime != expected.mtime:
+        if mtime_changed:
             raise TarIntegrityError(f"Directory structure changed: {expected.arc_path}")
         return
 
-    # ADR-002: File integrity
-    if stats.mtime != expected.mtime:
-        raise TarIntegrityError(f"File modified (mtime): {expected.arc_path}")
-
+    # ADR-002: File integrity. Size is checked first: with nanosecond
+    # mtimes any rewrite also moves the clock, and the size error is the
+    # more specific diagnosis when both changed.
     if not expected.is_symlink:
         if stats.size != expected.size:
             raise TarIntegrityError(f"File size changed: {expected.arc_path}")
 
+    if mtime_changed:
+        raise TarIntegrityError(f"File modified (mtime): {expected.arc_path}")
+
 
 def validate_root_structure_integrity(root_path: Path) -> None:
     """
@@ -1,9 +1,106 @@
+import functools
 import logging
+import struct
+from typing import Optional
 
 from tartape.schemas import EntryMetadata
 
 logger = logging.getLogger(__name__)
 
+# Full USTAR block packed in one C-level call:
+# name mode uid gid size mtime chksum typeflag linkname magic version
+# uname gname devmajor devminor prefix + 12 bytes of padding = 512.
+_HEADER_STRUCT = struct.Struct("100s8s8s8s12s12s8s1s100s6s2s32s32s8s8s155s12x")
+
+_LIMIT_USTAR_SIZE = 8589934591  # 8 GiB - 1 byte
+
+# The checksum field is summed as 8 spaces per the standard; packing this
+# constant in directly means the block needs no pre-splice before summing.
+_CHECKSUM_SPACES = b" " * 8
+
+
+def _text(value: str, width: int) -> bytes:
+    """UTF-8 encodes a string field, refusing silent struct truncation."""
+    data = value.encode("utf-8")
+    if len(data) > width:
+        raise ValueError(f"'{value}' too long for field ({len(data)} > {width})")
+    return data
+
+
+@functools.lru_cache(maxsize=512)
+def _octal(value: int, width: int) -> bytes:
+    """
+    Fixed-width octal field: zero-padded digits plus NULL terminator.
+
+    Memoized: the distinct values flowing through here (a handful of
+    modes, uid/gid 0, repeated mtimes within a recording second) repeat
+    massively across headers, so most encodes are dict hits.
+    """
+    octal_string = oct(int(value))[2:]
+    max_digits = width - 1
+    if len(octal_string) > max_digits:
+        raise ValueError(f"Number {value} too large for octal field width {width}")
+    return octal_string.zfill(max_digits).encode("ascii") + b"\0"
+
+
+def _size_field(size: int) -> bytes:
+    """USTAR octal for sizes up to 8 GiB - 1, GNU base-256 beyond."""
+    if size <= _LIMIT_USTAR_SIZE:
+        return _octal(size, 12)
+    return b"\x80" + size.to_bytes(11, byteorder="big")
+
+
+@functools.lru_cache(maxsize=8192)
+def _build_cached(key: tuple) -> bytes:
+    """
+    Encodes a 512-byte header from the explicit field tuple. The tuple is
+    the full set of attributes build() reads, so identical entries —
+    however many Track or EntryMetadata instances carry them — hit the
+    cache instead of redoing octal/base-256 encoding and the checksum.
+    """
+    (
+        arc_path, size, mtime, mode, uid, gid,
+        uname, gname, is_dir, is_symlink, linkname,
+    ) = key
+    entry = EntryMetadata(
+        arc_path=arc_path,
+        rel_path="",
+        size=size,
+        mtime=mtime,
+        mode=mode,
+        uid=uid,
+        gid=gid,
+        uname=uname,
+        gname=gname,
+        is_dir=is_dir,
+        is_symlink=is_symlink,
+        linkname=linkname,
+    )
+    return TarHeader(entry)._build()
+
+
+def build_header(entry) -> bytes:
+    """
+    Cached header build for any entry-like object (EntryMetadata or
+    Track). Hot paths call this directly to skip the TarHeader buffer
+    allocation on cache hits.
+    """
+    return _build_cached(
+        (
+            entry.arc_path,
+            entry.size,
+            int(entry.mtime),
+            entry.mode,
+            entry.uid,
+            entry.gid,
+            entry.uname,
+            entry.gname,
+            bool(entry.is_dir),
+            bool(entry.is_symlink),
+            entry.linkname or "",
+        )
+    )
+
 
 class TarHeader:
     """
@@ -19,16 +116,22 @@ class TarHeader:
     """
 
     def __init__(self, entry: EntryMetadata):
-        self.buffer = bytearray(512)
         self.entry = entry
 
-    def _split_path(self, path: str) -> tuple[str, str]:
+    def _split_path(
+        self, path: str, path_bytes: Optional[bytes] = None
+    ) -> tuple[str, str]:
         """
         Splits a path into (name, prefix) following USTAR (POSIX.1-1988)
         and TarTape's Strict Component Integrity (ADR-005).
         """
 
-        path_bytes = path.encode("utf-8")
+        # Encode the whole path once (or reuse the caller's encoding):
+        # every limit in this method is a UTF-8 byte limit, so validating
+        # the already-encoded components avoids one transcoding pass per
+        # component.
+        if path_bytes is None:
+            path_bytes = path.encode("utf-8")
 
         if len(path_bytes) > 255:
             raise ValueError(
@@ -36,178 +139,119 @@ class TarHeader:
                 f"USTAR standard limit is 255 bytes."
             )
 
-        components = path.split("/")
-        for component in components:
-            if len(component.encode("utf-8")) > 100:
-                raise ValueError(
-                    f"ADR-005 Violation: Path component '{component}' is too long "
-                    f"({len(component.encode('utf-8'))} bytes). "
-                    f"Max allowed per component is 100 bytes to ensure metadata integrity."
-                )
-
+        # A path that fits the name field outright cannot contain a
+        # component over 100 bytes either, so the validation loop below
+        # is redundant for it — return before paying for the split.
         if len(path_bytes) <= 100:
             return path, ""
 
-        # Find a '/' such that:
-        # - Left part (prefix) <= 155 bytes
-        # - Right part (name) <= 100 bytes
-        best_prefix, best_name = None, None
-
-        for i, char in enumerate(path):
-            if char == "/":
-                prefix = path[:i]
-                name = path[i + 1 :]
-                if not name:
-                    # USTAR Rule: The name cannot be empty after the cut
-                    continue
-                prefix_bytes = prefix.encode("utf-8")
-                name_bytes = name.encode("utf-8")
-                if len(prefix_bytes) <= 155 and len(name_bytes) <= 100:
-                    # This cut is valid, we're still looking for another one further to the right
-                    best_prefix, best_name = prefix, name
-
-        if best_name is None or best_prefix is None:
+        # Component check via find(): each probe is a C memchr, and no
+        # component list is materialized (split(b"/") would allocate one
+        # bytes object per component just to measure it).
+        prev = -1
+        total = len(path_bytes)
+        while True:
+            cut = path_bytes.find(b"/", prev + 1)
+            end = cut if cut != -1 else total
+            if end - prev - 1 > 100:
+                component = path_bytes[prev + 1 : end]
+                raise ValueError(
+                    f"ADR-005 Violation: Path component '{component.decode('utf-8')}' "
+                    f"is too long ({len(component)} bytes). "
+                    f"Max allowed per component is 100 bytes to ensure metadata integrity."
+                )
+            if cut == -1:
+                break
+            prev = cut
+
+        # Find the rightmost '/' such that:
+        # - Left part (prefix) <= 155 bytes  -> cut index <= 155
+        # - Right part (name) <= 100 bytes   -> cut index >= len - 101
+        # - Name is not empty                -> cut index < len - 1
+        # Both bounds are byte positions in the encoded path, so a single
+        # C-level rfind over that window replaces the per-character loop.
+        total = len(path_bytes)
+        cut = path_bytes.rfind(b"/", max(0, total - 101), min(156, total - 1))
+
+        if cut == -1:
             raise ValueError(
                 f"Path '{path}' cannot be split into USTAR prefix/name. "
                 f"Check that directory names are not preventing a valid split at a '/'."
             )
 
-        return best_name, best_prefix
-
-    def set_size(self, size: int):
-        """
-        Write the size using hybrid strategy: USTAR (Octal) or GNU (Base-256).
-        """
-        OFFSET = 124
-        FIELD_WIDTH = 12
-        LIMIT_USTAR = 8589934591  # 8 GiB - 1 byte
-
-        # Small/Normal File (USTAR Standard)
-        if size <= LIMIT_USTAR:
-            self.set_octal(OFFSET, FIELD_WIDTH, size)
-            return
-
-        # Giant File (GNU Base-256)
-        # The GNU standard says: If the size > 8GB, set the first byte to 0x80 (128)
-        # and use the remaining 11 bytes for the binary (Big-Endian) number.
-
-        # Write the binary flag in the first byte
-        self.buffer[OFFSET] = 0x80
-
-        binary_length = FIELD_WIDTH - 1  # 11 bytes
-        size_en_bytes = size.to_bytes(binary_length, byteorder="big")
-
-        # We write those 11 bytes right after the 0x80 marker.
-        # This covers offset 125 to 135.
-        for i in range(len(size_en_bytes)):
-            posicion = OFFSET + 1 + i
-            self.buffer[posicion] = size_en_bytes[i]
-
-    def set_string(self, offset: int, field_width: int, value: str):
-        """Writes a UTF-8 encoded and truncated string to the buffer."""
-        data = value.encode("utf-8")
-        if len(data) > field_width:
-            raise ValueError(
-                f"{offset=} '{value}' too long for field ({len(data)} > {field_width})"
-            )
-
-        self.buffer[offset : offset + len(data)] = data
-
-    def set_octal(self, offset: int, field_width: int, value: int):
-        """
-        Writes a number in octal format following the TAR standard:
-        1. Converts the number to octal.
-        2. Pads with leading zeros.
-        3. Leaves space for the NULL terminator at the end.
-        """
-        # Convert integer to octal string (e.g., 511 -> '777')
-        octal_string = oct(int(value))[2:]
-
-        # TAR standard expects the field to end with a NULL byte (\0)
-        # Therefore, available space for digits is field_width - 1
-        max_digits = field_width - 1
-
-        if len(octal_string) > max_digits:
-            raise ValueError(
-                f"Number {value} too large for octal field width {field_width}"
-            )
-
-        padded_octal = octal_string.zfill(max_digits)
-        final_string = padded_octal + "\0"
-        self.buffer[offset : offset + field_width] = final_string.encode("ascii")
-
-    def set_bytes(self, offset: int, value: bytes):
-        """Writes raw bytes at a specific offset."""
-        if offset + len(value) > 512:
-            raise ValueError(f"Write overflow at offset {offset}")
-
-        self.buffer[offset : offset + len(value)] = value
-
-    def calculate_checksum(self):
-        """
-        Calculates and writes the TAR header checksum (USTAR format).
-
-        The checksum is a simple sum of the numeric values of the 512 bytes in the header.
-        It is used strictly for basic header integrity verification.
-
-        TAR Standard Rules:
-        - The checksum field (offset 148, length 8 bytes) must be treated as if it
-          contained ASCII spaces (value 32) during calculation.
-        - The final value is stored as 6 octal digits, followed by a NULL byte and a space.
-        """
-
-        # Temporarily replace the 8 bytes with spaces (ASCII 32) per standard
-        self.buffer[148:156] = b" " * 8
-
-        # Calculate the sum of all 512 bytes
-        total_sum = sum(self.buffer)
-
-        # Format: 6 octal digits + NULL + Space
-        octal_sum = oct(total_sum)[2:]
-        octal_filled = octal_sum.zfill(6)
-        final_string = octal_filled + "\0" + " "
-
-        self.buffer[148:156] = final_string.encode("ascii")
+        # '/' is a single-byte character, so both halves are valid UTF-8.
+        return path_bytes[cut + 1 :].decode("utf-8"), path_bytes[:cut].decode("utf-8")
 
     def build(self) -> bytes:
-        """Constructs a header for an entry."""
+        """Constructs a header for an entry (cached across identical entries)."""
+        return build_header(self.entry)
+
+    def _build(self) -> bytes:
+        """Uncached encoding pass; called once per distinct entry."""
         # https://www.ibm.com/docs/en/zos/2.4.0?topic=formats-tar-format-tar-archives#taf__outar
-        full_arcpath = self.entry.arc_path
-        if self.entry.is_dir and not full_arcpath.endswith("/"):
+        entry = self.entry
+        full_arcpath = entry.arc_path
+        # Encode before the directory fixup: appending the slash to the
+        # bytes costs one byte, not a re-encode of the whole path. The
+        # str mirror is kept for the split path's error messages.
+        raw_arcpath = full_arcpath.encode("utf-8")
+        if entry.is_dir and not raw_arcpath.endswith(b"/"):
+            raw_arcpath += b"/"
             full_arcpath += "/"
 
-        name, prefix = self._split_path(full_arcpath)
-
-        self.set_string(0, 100, name)
-        # Prefix allows full path to reach 255 chars (155 prefix + 100 name)
-        self.set_string(345, 155, prefix)
-
-        self.set_octal(100, 8, self.entry.mode)
-        self.set_octal(108, 8, self.entry.uid)
-        self.set_octal(116, 8, self.entry.gid)
-        self.set_size(self.entry.size)
-        self.set_octal(136, 12, int(self.entry.mtime))
-        # User/Group Names
-        self.set_string(265, 32, self.entry.uname)
-        self.set_string(297, 32, self.entry.gname)
-
         # TYPE FLAG: '0' = File, '5' = Dir, '2' = Symlink
-        if self.entry.is_dir:
+        if entry.is_dir:
             type_flag = b"5"
-        elif self.entry.is_symlink:
+            linkname = b""
+        elif entry.is_symlink:
             type_flag = b"2"
-            self.set_string(157, 100, self.entry.linkname)
+            linkname = _text(entry.linkname, 100)
         else:
             type_flag = b"0"
-
-        self.set_bytes(156, type_flag)
-
-        # USTAR Signature (Essential for the Prefix field to be recognized)
-        self.set_string(257, 6, "ustar\0")
-        self.set_string(263, 2, "00")
-
-        self.calculate_checksum()
-        header = bytes(self.buffer)
+            linkname = b""
+
+        # Common-shape fast path: a regular file whose full path fits the
+        # 100-byte name field needs no prefix/name split and cannot
+        # violate the component or total limits, so the whole validation
+        # pass is skipped. The encoding is shared with the slow path.
+        if type_flag == b"0" and len(raw_arcpath) <= 100:
+            name, prefix = full_arcpath, ""
+        else:
+            name, prefix = self._split_path(full_arcpath, raw_arcpath)
+
+        # One C-level pack_into instead of ~17 field writes, laid out
+        # directly in the final buffer. The checksum field is packed as
+        # the 8 spaces the standard mandates for calculation, then the
+        # real value is packed over it in place — no intermediate copy.
+        buffer = bytearray(512)
+        _HEADER_STRUCT.pack_into(
+            buffer,
+            0,
+            _text(name, 100),
+            _octal(entry.mode, 8),
+            _octal(entry.uid, 8),
+            _octal(entry.gid, 8),
+            _size_field(entry.size),
+            _octal(int(entry.mtime), 12),
+            _CHECKSUM_SPACES,
+            type_flag,
+            linkname,
+            b"ustar\0",
+            b"00",
+            _text(entry.uname, 32),
+            _text(entry.gname, 32),
+            b"",  # devmajor (always zeroed)
+            b"",  # devminor (always zeroed)
+            # Prefix allows full path to reach 255 chars (155 prefix + 100 name)
+            _text(prefix, 155),
+        )
+
+        # 6 octal digits + NULL + space, per the USTAR checksum rules.
+        struct.pack_into(
+            "8s", buffer, 148, (oct(sum(buffer))[2:].zfill(6) + "\0 ").encode("ascii")
+        )
+
+        header = bytes(buffer)
         if len(header) != 512:
             raise ValueError("Header is not 512 bytes long.")
         return header
@@ -1,6 +1,7 @@
 from typing import Optional, cast
 
 from peewee import (
+    BlobField,
     BooleanField,
     CharField,
     IntegerField,
@@ -37,6 +38,9 @@ class Track(BaseModel):
     # Metadata fields (Mirroring EntryMetadata)
     size = cast(int, IntegerField())
     mtime = cast(int, IntegerField())
+    # Nanosecond precision for integrity checks; nullable so catalogs
+    # recorded before the column existed keep working (seconds fallback).
+    mtime_ns = cast(Optional[int], IntegerField(null=True))
     mode = cast(int, IntegerField())
     uid = cast(int, IntegerField())
     gid = cast(int, IntegerField())
@@ -52,6 +56,11 @@ class Track(BaseModel):
     start_offset = cast(int, IntegerField(null=True))
     end_offset = cast(int, IntegerField(null=True))
 
+    # Pre-built 512-byte USTAR header, computed once at record time.
+    # Nullable: older catalogs (and the rare path the builder cannot
+    # split) fall back to building the header at playback.
+    header_block = cast(Optional[bytes], BlobField(null=True))
+
     @property
     def is_file(self) -> bool:
         return not (self.is_dir or self.is_symlink)
@@ -62,9 +71,11 @@ class Track(BaseModel):
 
     @property
     def padding_size(self) -> int:
-        if not self.has_content or self.size == 0:
+        if not self.has_content:
             return 0
-        return (TAR_BLOCK_SIZE - (self.size % TAR_BLOCK_SIZE)) % TAR_BLOCK_SIZE
+        # TAR_BLOCK_SIZE is a power of two, so the double modulo reduces
+        # to a single AND mask.
+        return -self.size & (TAR_BLOCK_SIZE - 1)
 
     @property
     def total_block_size(self) -> int:
@@ -88,4 +99,5 @@ class Track(BaseModel):
             is_symlink=self.is_symlink,
             linkname=self.linkname or "",
             md5sum=self.md5sum,
+            mtime_ns=self.mtime_ns,
         )
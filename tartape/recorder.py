@@ -1,21 +1,26 @@
+import fnmatch
 import hashlib
 import json
 import logging
 import os
+import queue
+import re
 import shutil
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Iterable, Optional, cast
+from typing import Optional
 
 from tartape.cache import HashCacheManager
 from tartape.constants import TAPE_DB_NAME, TAPE_METADATA_DIR
 from tartape.database import DatabaseSession
 from tartape.exceptions import PathConstraintError, PathConstraintReportError
 from tartape.factory import ExcludeType, TarEntryFactory
+from tartape.header import build_header
 from tartape.schemas import EntryMetadata
 
-from .constants import DEFAULT_EXCLUDES, TAR_FOOTER_SIZE
+from .constants import DEFAULT_EXCLUDES, TAR_BLOCK_SIZE, TAR_FOOTER_SIZE
 from .models import TapeMetadata, Track
 
 logger = logging.getLogger(__name__)
@@ -29,11 +34,18 @@ class TapeRecorder:
         anonymize: bool = True,
         calculate_hashes: bool = False,
         auto_truncate: bool = False,
+        fingerprint_algo: str = "sha256",
     ):
         self.directory = Path(directory).resolve()
         self.calculate_hashes = calculate_hashes
         self.cache: Optional[HashCacheManager] = None
         self.auto_truncate = auto_truncate
+        # Identity fingerprint, not a security boundary: any hashlib-known
+        # algorithm is accepted (e.g. "blake2b" is faster than sha256 on
+        # machines without SHA-NI). Default stays sha256 so fingerprints of
+        # existing recordings remain comparable. Fail here, not at commit().
+        self.fingerprint_algo = fingerprint_algo
+        hashlib.new(fingerprint_algo)
 
         if self.calculate_hashes:
             logger.info(
@@ -50,6 +62,16 @@ class TapeRecorder:
         self.anonymize = anonymize
         self.tape_db_path = self.directory / TAPE_METADATA_DIR / TAPE_DB_NAME
 
+        # Precomputed for _should_exclude: boundary-anchored substring tests
+        # on the raw string avoid materializing path.parts for every entry.
+        self._tape_component_inner = os.sep + TAPE_METADATA_DIR + os.sep
+        self._tape_component_tail = os.sep + TAPE_METADATA_DIR
+        # rel_paths are sliced off the absolute string rather than computed
+        # with Path.relative_to per entry.
+        self._root_str = os.fspath(self.directory)
+        self._root_prefix_len = len(self._root_str) + len(os.sep)
+        self._compile_exclude_patterns()
+
         if self.tape_db_path.exists():
             raise FileExistsError(
                 f"Catalog already exists at: {self.tape_db_path}. "
@@ -61,15 +83,46 @@ class TapeRecorder:
         self.temp_session = DatabaseSession(self._temp_path)
         self.db = self.temp_session.connect()
 
+        # The temp DB is disposable until _finalize_storage moves it into
+        # place, so durability guarantees can be traded for insert speed.
+        for pragma in ("journal_mode=MEMORY", "synchronous=OFF", "temp_store=MEMORY"):
+            self.db.execute_sql(f"PRAGMA {pragma}")
+
+        # Precompute the raw insert statement once: executemany on the
+        # underlying sqlite3 cursor skips peewee's per-row value conversion.
+        self._track_fields = [field.name for field in Track._meta.sorted_fields]
+        placeholders = ", ".join("?" for _ in self._track_fields)
+        self._insert_sql = (
+            f"INSERT OR REPLACE INTO {Track._meta.table_name} "
+            f"({', '.join(self._track_fields)}) VALUES ({placeholders})"
+        )
+
         self._buffer = []
-        self._batch_size = 300
+        # executemany binds per row, so SQLite's bound-variable cap does
+        # not limit the batch size (that only constrained the old
+        # multi-row insert_many statement). Batches exist to amortize the
+        # writer-queue handoff and executemany call overhead; 1000 rows
+        # keeps a batch in the tens of kilobytes.
+        self._batch_size = 1000
+        # Headers are pure functions of the track fields, so they are built
+        # once here and stored as a BLOB instead of rebuilt per playback.
+        self._header_block_idx = self._track_fields.index("header_block")
 
     def _calculate_fingerprint(self):
         """Generates the identity hash based on the contents of the database."""
-        sha = hashlib.sha256()
-        for track in Track.select().order_by(Track.arc_path).iterator():
-            sha.update(f"{track.arc_path}|{track.size}|{track.mtime}".encode())
-        return sha.hexdigest()
+        # Assemble the whole payload first and hash it in a single update():
+        # one Python->C crossing instead of one per row, which lets OpenSSL
+        # process the buffer at full speed. The concatenated byte layout is
+        # identical to the previous per-row updates, so fingerprints of
+        # existing recordings are unaffected.
+        rows = (
+            Track.select(Track.arc_path, Track.size, Track.mtime)
+            .order_by(Track.arc_path)
+            .tuples()
+            .iterator()
+        )
+        payload = b"".join(f"{ap}|{sz}|{mt}".encode() for ap, sz, mt in rows)
+        return hashlib.new(self.fingerprint_algo, payload).hexdigest()
 
     def _finalize_storage(self):
         dest_dir = self.directory / TAPE_METADATA_DIR
@@ -91,33 +144,57 @@ class TapeRecorder:
             self._flush_buffer()
 
             with self.db.atomic():
-                # ADR-001: Important for deterministic ordering
-                tracks = cast(
-                    Iterable[Track], Track.select().order_by(Track.arc_path).iterator()
+                # ADR-001: Important for deterministic ordering.
+                # The Global Window is a pure prefix sum over block sizes, so
+                # project only the columns it needs instead of hydrating full
+                # Track models.
+                rows = (
+                    Track.select(
+                        Track.arc_path, Track.size, Track.is_dir, Track.is_symlink
+                    )
+                    .order_by(Track.arc_path)
+                    .tuples()
+                    .iterator()
                 )
-                current_global_offset = 0
-                batch = []
-
-                for track in tracks:
-                    # CALCULATE GLOBAL WINDOW
-                    track.start_offset = current_global_offset
-
-                    # Advance the cursor by the full block size (Header + Content + Padding)
-                    current_global_offset += track.total_block_size
 
-                    track.end_offset = current_global_offset
-                    batch.append(track)
-
-                    if len(batch) == self._batch_size:
-                        Track.bulk_update(
-                            batch, fields=[Track.start_offset, Track.end_offset]
+                mask = TAR_BLOCK_SIZE - 1
+                current_global_offset = 0
+                offset_rows = []
+
+                for arc_path, size, is_dir, is_symlink in rows:
+                    # Full block size: Header + Content + Padding
+                    content_size = 0 if (is_dir or is_symlink) else size
+                    block_size = TAR_BLOCK_SIZE + content_size + (-content_size & mask)
+
+                    offset_rows.append(
+                        (
+                            arc_path,
+                            current_global_offset,
+                            current_global_offset + block_size,
                         )
-                        batch = []
-                if batch:
-                    Track.bulk_update(
-                        batch, fields=[Track.start_offset, Track.end_offset]
                     )
-                    batch = []
+                    current_global_offset += block_size
+
+                # Write the offsets back through a temp table and one UPDATE:
+                # SQLite resolves the correlated lookups against the temp
+                # btree instead of re-planning one UPDATE per row.
+                cursor = self.db.cursor()
+                cursor.execute(
+                    "CREATE TEMP TABLE t_offsets "
+                    "(arc_path TEXT PRIMARY KEY, s INTEGER, e INTEGER)"
+                )
+                cursor.executemany(
+                    "INSERT INTO t_offsets (arc_path, s, e) VALUES (?, ?, ?)",
+                    offset_rows,
+                )
+                cursor.execute(
+                    f"UPDATE {Track._meta.table_name} SET "
+                    "start_offset = (SELECT s FROM t_offsets "
+                    f"WHERE t_offsets.arc_path = {Track._meta.table_name}.arc_path), "
+                    "end_offset = (SELECT e FROM t_offsets "
+                    f"WHERE t_offsets.arc_path = {Track._meta.table_name}.arc_path)"
+                )
+                cursor.execute("DROP TABLE t_offsets")
 
                 if callable(self.exclude):
                     func_name = getattr(self.exclude, "__name__", "custom_filter")
@@ -147,7 +224,15 @@ class TapeRecorder:
             self._temp_dir.cleanup()
 
     def _run_discovery(self):
-        """Scans the filesystem in a deterministic manner."""
+        """
+        Scans the filesystem using a pool of worker threads.
+
+        Directory listing is syscall-bound (os.scandir releases the GIL), so
+        several workers can overlap readdir/stat latency. Workers only collect
+        (arcname, path, stat) tuples; metadata extraction and DB writes stay
+        on the calling thread. Deterministic ordering (ADR-001) is restored by
+        sorting the collected entries by arcname before buffering.
+        """
         path_violations = []
         # Validate the root folder name itself
         try:
@@ -158,75 +243,231 @@ class TapeRecorder:
             path_violations.append(str(self.directory))
             safe_root_name = self.directory.name
 
+        discovered: list[tuple[str, Path, Optional[os.stat_result]]] = []
+
         if not path_violations:
-            self._add_to_buffer(self.directory, arcname=safe_root_name)
-            stack = [(self.directory, safe_root_name)]
-        else:
-            stack = [] # Skip discovery if the root itself fails and is not truncated
+            # One lstat up front for the root; every other entry reuses the
+            # stat cached on its DirEntry.
+            discovered.append((safe_root_name, self.directory, self.directory.lstat()))
+
+            pending: queue.Queue = queue.Queue()
+            pending.put((self.directory, safe_root_name))
+
+            # Same pattern as writer_errors in _writer_loop: workers record
+            # failures here and keep draining the queue, so pending.join()
+            # can never hang and commit() cannot succeed on a partial scan.
+            scan_errors: list = []
+
+            worker_count = min(32, (os.cpu_count() or 1) * 2)
+            workers = [
+                threading.Thread(
+                    target=self._scan_worker,
+                    args=(pending, discovered, path_violations, scan_errors),
+                    daemon=True,
+                )
+                for _ in range(worker_count)
+            ]
+            for worker in workers:
+                worker.start()
+
+            # Wait until every queued directory has been listed
+            pending.join()
+            for _ in workers:
+                pending.put(None)
+            for worker in workers:
+                worker.join()
 
+            if scan_errors:
+                raise scan_errors[0]
 
+        if not path_violations:
+            # Deterministic ordering (ADR-001): parallel discovery collects
+            # entries in arbitrary order, so sort once before buffering.
+            discovered.sort(key=lambda item: item[0])
+
+            # Metadata extraction (and optional MD5 hashing) overlaps with
+            # SQLite commit latency: full batches are handed to a dedicated
+            # writer thread via a bounded queue, producer/consumer style.
+            # The sqlite3 connection is shared (check_same_thread=False) but
+            # only the writer touches it until the queue is drained.
+            write_q: queue.Queue = queue.Queue(maxsize=4)
+            writer_errors: list = []
+            writer = threading.Thread(
+                target=self._writer_loop,
+                args=(write_q, self.db.connection(), writer_errors),
+                daemon=True,
+            )
+            writer.start()
+
+            # Buffer in batch-sized slices so the flush decision is amortized
+            # over the whole batch instead of being re-checked per entry.
+            batch_size = self._batch_size
+            try:
+                for start in range(0, len(discovered), batch_size):
+                    for arcname, full_path, cached_stat in discovered[
+                        start : start + batch_size
+                    ]:
+                        self._add_to_buffer(
+                            full_path, arcname=arcname, precomputed_stat=cached_stat
+                        )
+                    if self._buffer:
+                        write_q.put(self._buffer)
+                        self._buffer = []
+            finally:
+                write_q.put(None)
+                writer.join()
+
+            if writer_errors:
+                raise writer_errors[0]
+
+        # REPORT ALL VIOLATIONS AT ONCE
+        if path_violations:
+            path_violations.sort()
+            # We show up to 50 to avoid crashing the console with massive strings
+            display_violations = path_violations[:50]
+            report = "\n  - ".join(display_violations)
+            if len(path_violations) > 50:
+                report += f"\n  ... and {len(path_violations) - 50} more."
+
+            raise PathConstraintReportError(
+                f"Discovery aborted. {len(path_violations)} path(s) violate USTAR limitations "
+                "(Max 255 total bytes or 100 bytes per folder/file name):\n"
+                f"  - {report}\n\n"
+                "To automatically shorten these paths and prevent collisions, use 'auto_truncate=True' in create()."
+            )
 
-        while stack:
-            curr_dir, arc_prefix = stack.pop()
+    def _scan_worker(
+        self,
+        pending: queue.Queue,
+        discovered: list,
+        path_violations: list,
+        scan_errors: list,
+    ):
+        """
+        Pops directories off the shared queue, lists them and enqueues their
+        subdirectories. Appends to the shared lists rely on the GIL making
+        list.append atomic; ordering is fixed later by the caller's sort.
+        """
+        # Bind the per-entry lookups to locals once: the inner loop runs
+        # millions of times on big trees and each attribute chain costs
+        # a dict lookup per iteration.
+        should_exclude = self._should_exclude
+        resolve_arcname = TarEntryFactory.resolve_arcname
+        auto_truncate = self.auto_truncate
+        collect = discovered.append
+        report_violation = path_violations.append
+        enqueue = pending.put
+
+        while True:
+            item = pending.get()
+            if item is None:
+                pending.task_done()
+                break
+
+            # A sibling already failed: drain without scanning so the
+            # producer's pending.join() still completes.
+            if scan_errors:
+                pending.task_done()
+                continue
+
+            curr_dir, arc_prefix = item
+            subdirs = []
             try:
                 # os.scandir to retrieve DirEntry objects which cache the stat() call
                 with os.scandir(curr_dir) as it:
-                    # Sort them to guarantee deterministic ordering (ADR-001)
-                    entries = sorted(list(it), key=lambda e: e.name)
-                    for entry in entries:
+                    for entry in it:
                         full_path = Path(entry.path)
 
-                        if self._should_exclude(full_path):
+                        if should_exclude(full_path, entry.path):
                             continue
 
                         raw_arc_name = f"{arc_prefix}/{entry.name}"
 
                         try:
-                            safe_arc_name = TarEntryFactory.resolve_arcname(
-                                raw_arc_name, auto_truncate=self.auto_truncate
+                            safe_arc_name = resolve_arcname(
+                                raw_arc_name, auto_truncate=auto_truncate
                             )
                         except PathConstraintError:
                             # Accumulate error and skip adding this file/folder
-                            path_violations.append(str(full_path))
+                            report_violation(str(full_path))
                             continue
 
                         # Retrieve the cached stat information to avoid a redundant disk syscall
                         cached_stat = entry.stat(follow_symlinks=False)
 
-                        self._add_to_buffer(
-                            full_path,
-                            arcname=safe_arc_name,
-                            precomputed_stat=cached_stat
-                        )
+                        collect((safe_arc_name, full_path, cached_stat))
 
                         # Check if it's a directory using the fast cached method
                         if entry.is_dir(follow_symlinks=False):
-                            stack.append((full_path, safe_arc_name))
+                            subdirs.append((full_path, safe_arc_name))
+
+                # Enqueue the children as one sorted batch: entries are then
+                # produced in near-arcname order, which keeps the SQLite
+                # btree inserts mostly append-only (fewer page splits) and
+                # shrinks the work left for the final sort.
+                subdirs.sort(key=lambda pair: pair[1])
+                for subdir in subdirs:
+                    enqueue(subdir)
 
             except PermissionError:
                 logger.warning(f"Permission denied: {curr_dir}")
-
-        # REPORT ALL VIOLATIONS AT ONCE
-        if path_violations:
-            # We show up to 50 to avoid crashing the console with massive strings
-            display_violations = path_violations[:50]
-            report = "\n  - ".join(display_violations)
-            if len(path_violations) > 50:
-                report += f"\n  ... and {len(path_violations) - 50} more."
-
-            raise PathConstraintReportError(
-                f"Discovery aborted. {len(path_violations)} path(s) violate USTAR limitations "
-                "(Max 255 total bytes or 100 bytes per folder/file name):\n"
-                f"  - {report}\n\n"
-                "To automatically shorten these paths and prevent collisions, use 'auto_truncate=True' in create()."
-            )
+            except Exception as e:
+                # Anything else (e.g. a file deleted between scandir and
+                # stat) must surface from commit(), not silently shrink
+                # the catalog.
+                scan_errors.append(e)
+            finally:
+                pending.task_done()
+
+    def _writer_loop(self, write_q: queue.Queue, raw_conn, errors: list):
+        """
+        Consumes row batches from the queue inside one transaction covering
+        the whole discovery: the parse/sync cost is paid once instead of per
+        batch, and a failed run leaves no partial catalog behind.
+        sqlite3_step releases the GIL, so inserts run while the producer
+        keeps extracting metadata. On failure the error is recorded and the
+        queue keeps draining so the producer never blocks on a full queue.
+        """
+        in_transaction = False
+        while True:
+            batch = write_q.get()
+            if batch is None:
+                break
+            if errors:
+                continue
+            try:
+                if not in_transaction:
+                    raw_conn.execute("BEGIN")
+                    in_transaction = True
+                raw_conn.executemany(self._insert_sql, batch)
+            except Exception as exc:
+                try:
+                    raw_conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+                in_transaction = False
+                errors.append(exc)
+
+        if in_transaction:
+            try:
+                raw_conn.execute("COMMIT")
+            except Exception as exc:
+                try:
+                    raw_conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+                errors.append(exc)
 
     def _add_to_buffer(self, source_path: Path, arcname: str, precomputed_stat: Optional[os.stat_result] = None):
         """Parses a file and adds it to the insert buffer."""
 
-        rel_path = source_path.relative_to(self.directory).as_posix()
-        if rel_path == ".":
-            rel_path = ""
+        # String slice instead of Path.relative_to: every discovered path is
+        # an absolute child of the (resolved) root, so the relative part is
+        # simply the tail after "<root><sep>".
+        path_str = os.fspath(source_path)
+        rel_path = path_str[self._root_prefix_len :]
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
 
         metadata: Optional[EntryMetadata] = TarEntryFactory.create_metadata(
             source_path,
@@ -239,41 +480,80 @@ class TapeRecorder:
         )
 
         if metadata:
-            track = Track(
-                arc_path=metadata.arc_path,
-                rel_path=metadata.rel_path,
-                size=metadata.size,
-                mtime=metadata.mtime,
-                mode=metadata.mode,
-                uid=metadata.uid,
-                gid=metadata.gid,
-                uname=metadata.uname,
-                gname=metadata.gname,
-                is_dir=metadata.is_dir,
-                is_symlink=metadata.is_symlink,
-                linkname=metadata.linkname,
-                md5sum=metadata.md5sum,
-            )
+            # Buffer a plain value tuple aligned to the insert statement:
+            # instantiating a Track model per entry just to read __data__
+            # back out in flush() allocates a dict per row for nothing.
+            row = [getattr(metadata, name, None) for name in self._track_fields]
+            try:
+                row[self._header_block_idx] = build_header(metadata)
+            except ValueError:
+                # Path the USTAR splitter cannot handle (e.g. no valid
+                # prefix/name cut); leave NULL so playback reports it.
+                pass
+            self._buffer.append(tuple(row))
+
+    def _compile_exclude_patterns(self):
+        """
+        Precompiles str/list excludes into one alternation regex so the scan
+        pays a single C-level match per entry instead of constructing a
+        pathlib pattern matcher per (path, pattern) pair.
+        """
+        self._exclude_name_re: Optional[re.Pattern] = None
+        self._exclude_names: frozenset = frozenset()
+        self._exclude_path_patterns: list = []
+
+        # User callables predate the threaded scan and may be stateful
+        # (closures over a counter, an open manifest, ...), so they are
+        # serialized behind this lock instead of being invoked from up to
+        # 32 workers at once. Pattern excludes stay lock-free.
+        self._exclude_call_lock = (
+            threading.Lock() if callable(self.exclude) else None
+        )
+
+        if self.exclude is None or callable(self.exclude):
+            return
 
-            self._buffer.append(track)
+        if isinstance(self.exclude, str):
+            patterns = [self.exclude]
+        elif isinstance(self.exclude, list):
+            patterns = list(self.exclude)
+        else:
+            return
 
-            if len(self._buffer) >= self._batch_size:
-                self._flush_buffer()
+        # Slashless globs only ever match the basename; multi-component
+        # patterns keep the pathlib matching semantics.
+        name_patterns = [p for p in patterns if "/" not in p]
+        self._exclude_path_patterns = [p for p in patterns if "/" in p]
+        if name_patterns:
+            self._exclude_name_re = re.compile(
+                "|".join(fnmatch.translate(p) for p in name_patterns)
+            )
+        self._exclude_names = frozenset(patterns)
 
-    def _should_exclude(self, path: Path) -> bool:
+    def _should_exclude(self, path: Path, path_str: Optional[str] = None) -> bool:
         """Determines if a path should be skipped based on the 'self.exclude'."""
 
-        if TAPE_METADATA_DIR in path.parts:
+        if path_str is None:
+            path_str = str(path)
+        if self._tape_component_inner in path_str or path_str.endswith(
+            self._tape_component_tail
+        ):
             return True
         if self.exclude is None:
             return False
         if callable(self.exclude):
-            return self.exclude(path)
-        if isinstance(self.exclude, str):
-            return path.match(self.exclude) or path.name == self.exclude
-        if isinstance(self.exclude, list):
-            return any(path.match(p) or path.name == p for p in self.exclude)
-        return False
+            with self._exclude_call_lock:
+                return self.exclude(path)
+
+        if self._exclude_names or self._exclude_name_re is not None:
+            name = path.name
+            if name in self._exclude_names:
+                return True
+            if self._exclude_name_re is not None and self._exclude_name_re.match(
+                name
+            ):
+                return True
+        return any(path.match(p) for p in self._exclude_path_patterns)
 
     def _flush_buffer(self):
         """Write the buffer to the database."""
@@ -281,8 +561,7 @@ class TapeRecorder:
             return
 
         with self.db.atomic():
-            data = [t.__data__ for t in self._buffer]
-            Track.insert_many(data).on_conflict_replace().execute()
+            self.db.cursor().executemany(self._insert_sql, self._buffer)
 
         self._buffer = []
 
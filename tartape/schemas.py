@@ -18,11 +18,12 @@ class EntryState(str, Enum):
     TAIL = "tail"  # It comes from the past and ends in this volume
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiskEntryStats:
     exists: bool
     size: int = 0
     mtime: int = 0
+    mtime_ns: int = 0
     mode: int = 0
     uid: int = 0
     gid: int = 0
@@ -34,56 +35,71 @@ class DiskEntryStats:
     linkname: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileStartMetadata:
     start_offset: int
     resumed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEndMetadata:
     end_offset: int
     md5sum: Optional[str]
     is_complete: bool
 
 
-@dataclass(frozen=True)
+# Events are allocated once per chunk on the hot streaming path, so they
+# use slots: no per-instance __dict__, cheaper construction, less GC churn.
+@dataclass(frozen=True, slots=True)
 class TarFileStartEvent:
     type: Literal["file_start"]
     entry: "ManifestEntry"
     metadata: FileStartMetadata
 
-    model_config = {"arbitrary_types_allowed": True}
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TarFileDataEvent:
     type: Literal["file_data"]
-    data: bytes
+    # May be a memoryview into a reused or mapped buffer on zero-copy
+    # paths: consume or copy it before pulling the next event.
+    data: Union[bytes, memoryview]
+
+
+@dataclass(frozen=True, slots=True)
+class TarFileHoleEvent:
+    """
+    An all-zero run (padding or footer), emitted instead of literal zero
+    bytes when the generator runs with emit_holes=True. Sinks that support
+    it can punch a hole (fallocate/seek) at zero I/O cost; everyone else
+    should write `length` zero bytes.
+    """
 
-    model_config = {"arbitrary_types_allowed": True}
+    type: Literal["file_hole"]
+    length: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TarFileEndEvent:
     type: Literal["file_end"]
     entry: "ManifestEntry"
     metadata: FileEndMetadata
 
-    model_config = {"arbitrary_types_allowed": True}
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TarTapeCompletedEvent:
     type: Literal["tape_completed"]
 
 
 TarEvent = Union[
-    TarFileStartEvent, TarFileDataEvent, TarFileEndEvent, TarTapeCompletedEvent
+    TarFileStartEvent,
+    TarFileDataEvent,
+    TarFileHoleEvent,
+    TarFileEndEvent,
+    TarTapeCompletedEvent,
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ByteWindow:
     """
     Represents a specific segment of the byte stream.
@@ -114,7 +130,7 @@ class ByteWindow:
         """Check if a file's byte range overlaps with this window."""
         return other_start < self.end and other_end > self.start
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntryMetadata:
     """
     Pure identity and filesystem attributes of a file or directory.
@@ -134,6 +150,9 @@ class EntryMetadata:
     is_symlink: bool = False
     linkname: str = ""
     md5sum: Optional[str] = None
+    # Nanosecond mtime for exact integer integrity compares. Optional:
+    # catalogs recorded before this field existed only carry seconds.
+    mtime_ns: Optional[int] = None
 
     @property
     def has_content(self) -> bool:
@@ -145,7 +164,9 @@ class EntryMetadata:
         """Calculates the null bytes needed to align the file to a 512-byte block."""
         if not self.has_content or self.size == 0:
             return 0
-        return (TAR_BLOCK_SIZE - (self.size % TAR_BLOCK_SIZE)) % TAR_BLOCK_SIZE
+        # TAR_BLOCK_SIZE is a power of two, so the double modulo reduces
+        # to a single AND mask.
+        return -self.size & (TAR_BLOCK_SIZE - 1)
 
     @property
     def total_block_size(self) -> int:
@@ -157,12 +178,15 @@ class EntryMetadata:
         return TAR_BLOCK_SIZE + content_size + self.padding_size
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManifestEntry:
     info: EntryMetadata
     state: EntryState
     global_window: ByteWindow
     local_window: ByteWindow
+    # Header bytes precomputed at record time; None means the stream
+    # builds (and caches) the header itself.
+    header_block: Optional[bytes] = None
 
     @property
     def is_file(self) -> bool:
@@ -223,10 +247,11 @@ class ManifestEntry:
             global_window=global_window,
             local_window=ByteWindow(start=local_start, end=local_end),
             state=state,
+            header_block=track.header_block,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolumeManifest:
     tape_fingerprint: str
     volume_index: int
@@ -1,12 +1,18 @@
+import bisect
+import errno
 import hashlib
 import io
 import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator, Iterable, Optional
+from typing import Generator, Iterable, Optional, Sequence
 
 from tartape.exceptions import InvalidOffsetError, TarIntegrityError, VolumeStateError
 from tartape.factory import validate_integrity
-from tartape.header import TarHeader
+from tartape.header import build_header
 
 from .constants import CHUNK_SIZE_DEFAULT, TAR_BLOCK_SIZE, TAR_FOOTER_SIZE
 from .schemas import (
@@ -16,6 +22,7 @@ from .schemas import (
     TarEvent,
     TarFileDataEvent,
     TarFileEndEvent,
+    TarFileHoleEvent,
     TarFileStartEvent,
     TarTapeCompletedEvent,
     VolumeManifest,
@@ -23,6 +30,58 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Files at or above this size are memory-mapped instead of read chunk by
+# chunk: slicing the map serves chunks straight from the page cache with no
+# read(2) per chunk. Small files are not worth the mmap/munmap setup cost.
+MMAP_THRESHOLD = 256 * 1024
+
+# Shared immutable zero buffer for padding and the end-of-archive footer.
+# Large enough for the biggest all-zero run we ever emit in one event
+# (the two-block footer); padding yields a slice of it instead of
+# allocating a fresh bytes object per entry.
+_ZERO_BLOCK = bytes(TAR_FOOTER_SIZE)
+
+# Pre-sliced zero runs, one per possible length up to the footer size.
+# _ZERO_BLOCK[:n] would still allocate a fresh bytes object per padding
+# emission; indexing this table reuses the same interned slices forever
+# (~0.5 MB once, paid at import).
+_PAD = tuple(_ZERO_BLOCK[:i] for i in range(TAR_FOOTER_SIZE + 1))
+
+# How many entries the prefetch thread may run ahead of the stream.
+# Bounds the amount of warmed-but-unused cache if the consumer stalls.
+PREFETCH_LOOKAHEAD = 256
+
+# MD5 of zero bytes — a known constant, so empty files skip hashing
+# (and the whole open/read cycle) entirely.
+_EMPTY_MD5 = "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def _stream_window(
+    global_skip: int, block_start: int, block_length: int
+) -> tuple[int, int]:
+    """
+    Given a global resume position and a data block, calculate the local
+    offset and how many bytes actually need to be sent.
+
+    Module-level so the hot loop pays no method binding or attribute
+    lookup per call — only plain integer arithmetic.
+
+    Returns: (local_skip, bytes_to_send)
+    """
+    block_end = block_start + block_length
+
+    # Case: The restart point has now passed this entire block
+    if global_skip >= block_end:
+        return 0, 0
+
+    # Case: The block is within or beyond the resume point
+    local_skip = max(0, global_skip - block_start)
+    bytes_to_send = block_length - local_skip
+
+    return local_skip, bytes_to_send
+
+
+
 
 class TapeVolume(io.BufferedIOBase):
     def __init__(self, name: str, size: int):
@@ -39,11 +98,82 @@ class TapeVolume(io.BufferedIOBase):
 
 
 class TarStreamGenerator:
-    def __init__(self, entries: Iterable[ManifestEntry], directory: str | Path):
+    def __init__(
+        self,
+        entries: Iterable[ManifestEntry],
+        directory: str | Path,
+        emit_holes: bool = False,
+        reuse_buffers: bool = False,
+    ):
         self.directory = Path(directory)
+        # Cached string form: hot paths join rel_paths onto it with
+        # os.path.join instead of rebuilding Path objects per entry.
+        self._directory_str = os.fspath(self.directory)
         self.entries = entries
+        # When True, padding and the footer are announced as
+        # TarFileHoleEvent instead of literal zero bytes, letting
+        # sparse-capable sinks punch holes instead of writing zeros.
+        self.emit_holes = emit_holes
+        # When True, data events carry memoryviews into two recycled read
+        # buffers (zero-copy, but each event must be consumed or copied
+        # before pulling the next one). Off by default: a consumer that
+        # accumulates events would silently see corrupted data, so the
+        # safe default pays one copy per chunk — the same trade the mmap
+        # path already makes.
+        self.reuse_buffers = reuse_buffers
+        # Hashing side-car, created for the duration of a stream() pass.
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
 
     def stream(
+        self,
+        start_offset: int = 0,
+        chunk_size: Optional[int] = None,
+        coalesce: bool = False,
+    ) -> Generator[TarEvent, None, None]:
+        """
+        Yields the event stream for the tape. With coalesce=True,
+        contiguous data emissions (header / content / padding of one
+        entry) are merged into chunk-sized super-chunks, trading one
+        buffer copy for far fewer events on small-file heavy tapes.
+        """
+        events = self._stream_events(start_offset, chunk_size)
+        if coalesce:
+            events = self._coalesce_events(events, chunk_size or CHUNK_SIZE_DEFAULT)
+        return events
+
+    def _coalesce_events(
+        self, events: Generator[TarEvent, None, None], chunk_size: int
+    ) -> Generator[TarEvent, None, None]:
+        """
+        Merges adjacent data events into super-chunks. Any buffered bytes
+        are flushed before a non-data event is forwarded, so data is never
+        reordered relative to file_start/file_end markers.
+        """
+        buffer = bytearray()
+
+        for event in events:
+            if event.type == "file_data":
+                data = event.data
+                # Large chunks pass through untouched (no copy).
+                if not buffer and len(data) >= chunk_size:
+                    yield event
+                    continue
+                buffer += data
+                while len(buffer) >= chunk_size:
+                    yield TarFileDataEvent(
+                        type="file_data", data=bytes(buffer[:chunk_size])
+                    )
+                    del buffer[:chunk_size]
+            else:
+                if buffer:
+                    yield TarFileDataEvent(type="file_data", data=bytes(buffer))
+                    buffer.clear()
+                yield event
+
+        if buffer:
+            yield TarFileDataEvent(type="file_data", data=bytes(buffer))
+
+    def _stream_events(
         self, start_offset: int = 0, chunk_size: Optional[int] = None
     ) -> Generator[TarEvent, None, None]:
 
@@ -53,35 +183,264 @@ class TarStreamGenerator:
         )
 
         last_offset = 0
+        entries = self.entries
+
+        # Entries are ordered by offset (ADR-001), so when we have random
+        # access we can bisect to the first entry the resume point touches
+        # instead of walking (and skipping) a potentially huge prefix.
+        if start_offset > 0 and isinstance(entries, Sequence):
+            start_idx = bisect.bisect_right(
+                entries, start_offset, key=lambda e: e.global_window.end
+            )
+            if start_idx > 0:
+                last_offset = entries[start_idx - 1].global_window.end
+            entries = entries[start_idx:]
+
+        # Warm the inode/page cache ahead of the stream so the per-entry
+        # lstat in validate_integrity (and the first reads) hit hot caches
+        # instead of stalling the streaming thread on cold disks.
+        prefetch_stop = None
+        progress = [0]
+        if isinstance(entries, Sequence) and len(entries) > 1:
+            prefetch_stop = self._start_prefetch(entries, progress)
+
+        # hashlib releases the GIL on updates >= 2 KiB, so a single worker
+        # can digest the previous chunk while this thread reads the next
+        # one (double buffering). More workers would not help: updates of
+        # one stream are inherently sequential.
+        self._hash_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tartape-md5"
+        )
+
+        try:
+            for index, entry in enumerate(entries):
+                progress[0] = index
+
+                # One attribute walk per entry; the window coordinates are
+                # reused several times below.
+                window = entry.global_window
+                win_start, win_end = window.start, window.end
+
+                # If we already passed this entire file, we skip it
+                if start_offset >= win_end:
+                    last_offset = win_end
+                    continue
+
+                # Fast path: a fresh small file fits (header + content) inside
+                # one chunk, so it is emitted as a single event instead of two.
+                # Halves the event and downstream syscall count for trees
+                # dominated by small files.
+                if (
+                    entry.has_content
+                    and 0 < entry.info.size <= effective_chunk_size - TAR_BLOCK_SIZE
+                    and start_offset <= win_start
+                ):
+                    yield self._create_event_start(entry, start_offset)
+                    md5_hash = yield from self._emit_fused_small_file(entry)
+                    yield from self._emit_padding(entry, start_offset)
+                    yield self._create_event_end(entry, md5_hash)
+                    last_offset = win_end
+                    continue
+
+                # Always played whenever the stream touches this file.
+                yield self._create_event_start(entry, start_offset)
+                yield from self._emit_header(entry, start_offset)
+
+                md5_hash: Optional[str] = None
+                if entry.has_content:
+                    md5_hash = yield from self._stream_file_content_safely(
+                        entry, start_offset, effective_chunk_size
+                    )
+                    yield from self._emit_padding(entry, start_offset)
+
+                yield self._create_event_end(entry, md5_hash)
+                last_offset = win_end
+        finally:
+            if prefetch_stop is not None:
+                prefetch_stop.set()
+            self._hash_pool.shutdown(wait=False)
+            self._hash_pool = None
+
+        yield from self._emit_stream_gen_footer(start_offset, last_offset)
+        yield TarTapeCompletedEvent(type="tape_completed")
+        logger.info("TAR stream completed successfully.")
+
+    def _build_header(self, entry: ManifestEntry) -> bytes:
+        # Prefer the header persisted at record time; fall back to the
+        # (cached) builder for catalogs without the column populated.
+        return entry.header_block or build_header(entry.info)
+
+    def stream_to_fd(self, out_fd: int, start_offset: int = 0) -> int:
+        """
+        Zero-copy variant of stream(): writes the TAR byte stream straight
+        to a file descriptor. File bodies go through os.sendfile where
+        available, so content never crosses into user space.
+
+        No events are emitted and no MD5 is computed — callers that need
+        per-file digests should use stream(). Integrity checks (ADR-002)
+        still run per entry. Returns the number of bytes written.
+        """
+        written = 0
+        last_offset = 0
+        entries = self.entries
+
+        if start_offset > 0 and isinstance(entries, Sequence):
+            start_idx = bisect.bisect_right(
+                entries, start_offset, key=lambda e: e.global_window.end
+            )
+            if start_idx > 0:
+                last_offset = entries[start_idx - 1].global_window.end
+            entries = entries[start_idx:]
 
-        for entry in self.entries:
+        sendfile = getattr(os, "sendfile", None)
 
-            # If we already passed this entire file, we skip it
-            if start_offset >= entry.global_window.end:
-                last_offset = entry.global_window.end
+        for entry in entries:
+            window = entry.global_window
+            if start_offset >= window.end:
+                last_offset = window.end
                 continue
 
-            # Always played whenever the stream touches this file.
-            yield self._create_event_start(entry, start_offset)
-            yield from self._emit_header(entry, start_offset)
+            local_skip, bytes_to_send = _stream_window(
+                start_offset, window.start, TAR_BLOCK_SIZE
+            )
+            if bytes_to_send > 0:
+                written += self._write_all(
+                    out_fd, self._build_header(entry)[local_skip:]
+                )
 
-            md5_hash: Optional[str] = None
             if entry.has_content:
-                md5_hash = yield from self._stream_file_content_safely(
-                    entry, start_offset, effective_chunk_size
+                written += self._sendfile_content(
+                    out_fd, entry, start_offset, sendfile
                 )
-                yield from self._emit_padding(entry, start_offset)
+                padding_total = window.end - entry.content_end_offset
+                _, bytes_to_send = _stream_window(
+                    start_offset, entry.content_end_offset, padding_total
+                )
+                if bytes_to_send > 0:
+                    written += self._write_all(out_fd, _PAD[bytes_to_send])
 
-            yield self._create_event_end(entry, md5_hash)
-            last_offset = entry.global_window.end
+            last_offset = window.end
 
-        yield from self._emit_stream_gen_footer(start_offset, last_offset)
-        yield TarTapeCompletedEvent(type="tape_completed")
-        logger.info("TAR stream completed successfully.")
+        _, bytes_to_send = _stream_window(
+            start_offset, last_offset, TAR_FOOTER_SIZE
+        )
+        if bytes_to_send > 0:
+            written += self._write_all(out_fd, _PAD[bytes_to_send])
+
+        return written
+
+    @staticmethod
+    def _write_all(out_fd: int, data: bytes) -> int:
+        view = memoryview(data)
+        total = 0
+        while total < len(view):
+            total += os.write(out_fd, view[total:])
+        return total
+
+    def _sendfile_content(
+        self, out_fd: int, entry: ManifestEntry, global_skip: int, sendfile
+    ) -> int:
+        local_skip, bytes_remaining = _stream_window(
+            global_skip, entry.header_end_offset, entry.info.size
+        )
+        if bytes_remaining <= 0:
+            return 0
 
-    def _build_header(self, entry: ManifestEntry) -> bytes:
-        header = TarHeader(entry.info)
-        return header.build()
+        source_path = os.path.join(self._directory_str, entry.info.rel_path)
+        validate_integrity(entry.info, self._directory_str)
+
+        sent_total = 0
+        try:
+            f = open(source_path, "rb", buffering=0)
+        except OSError as e:
+            raise TarIntegrityError(f"Error reading {source_path}") from e
+
+        with f:
+            in_fd = f.fileno()
+            offset = local_skip
+            while bytes_remaining > 0:
+                if sendfile is not None:
+                    try:
+                        sent = sendfile(out_fd, in_fd, offset, bytes_remaining)
+                    except OSError as e:
+                        # os.sendfile existing does not mean it works for
+                        # this fd pair: macOS/BSD only accept sockets as
+                        # the destination. Same fallback set as shutil's
+                        # fastcopy: drop to pread/write and keep going.
+                        if e.errno in (
+                            errno.ENOTSOCK,
+                            errno.EINVAL,
+                            errno.ENOSYS,
+                            errno.EOPNOTSUPP,
+                        ):
+                            sendfile = None
+                            continue
+                        raise
+                else:
+                    try:
+                        chunk = os.pread(
+                            in_fd, min(CHUNK_SIZE_DEFAULT, bytes_remaining), offset
+                        )
+                    except OSError as e:
+                        raise TarIntegrityError(
+                            f"Error reading {source_path}"
+                        ) from e
+                    # Write-side errors (full disk, closed pipe, bad fd)
+                    # propagate as plain OSError: they say nothing about
+                    # the source file's integrity.
+                    sent = self._write_all(out_fd, chunk) if chunk else 0
+                if sent == 0:
+                    raise TarIntegrityError(f"File shrunk: '{source_path}'")
+                offset += sent
+                bytes_remaining -= sent
+                sent_total += sent
+
+        return sent_total
+
+    def _start_prefetch(
+        self, entries: Sequence[ManifestEntry], progress: list
+    ) -> threading.Event:
+        """
+        Starts a daemon thread that runs ahead of the stream, warming the
+        inode cache (lstat) and asking the kernel to prefetch file content
+        (fadvise WILLNEED). `progress` is the consumer's current index; the
+        worker stays at most PREFETCH_LOOKAHEAD entries ahead of it.
+        """
+        stop = threading.Event()
+        worker = threading.Thread(
+            target=self._prefetch_loop,
+            args=(entries, progress, stop),
+            daemon=True,
+            name="tartape-prefetch",
+        )
+        worker.start()
+        return stop
+
+    def _prefetch_loop(
+        self, entries: Sequence[ManifestEntry], progress: list, stop: threading.Event
+    ) -> None:
+        fadvise = getattr(os, "posix_fadvise", None)
+
+        for index, entry in enumerate(entries):
+            while index - progress[0] > PREFETCH_LOOKAHEAD:
+                if stop.wait(0.05):
+                    return
+            if stop.is_set():
+                return
+
+            path = os.path.join(self._directory_str, entry.info.rel_path)
+            try:
+                # The lstat warms the inode cache for validate_integrity;
+                # errors are left for the streaming thread to report.
+                os.lstat(path)
+                if fadvise and entry.has_content and entry.info.size > 0:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        fadvise(fd, 0, entry.info.size, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(fd)
+            except OSError:
+                continue
 
     def _create_event_start(
         self, entry: ManifestEntry, global_skip: int
@@ -111,65 +470,148 @@ class TarStreamGenerator:
     def _emit_header(
         self, entry: ManifestEntry, global_skip: int
     ) -> Generator[TarEvent, None, None]:
-        local_skip, bytes_to_send = self._get_stream_window(
+        local_skip, bytes_to_send = _stream_window(
             global_skip, entry.global_window.start, TAR_BLOCK_SIZE
         )
         if bytes_to_send > 0:
             header = self._build_header(entry)[local_skip:]
             yield TarFileDataEvent(type="file_data", data=header)
 
-    def _get_stream_window(
-        self, global_skip: int, block_start: int, block_length: int
-    ) -> tuple[int, int]:
-        """
-        Given a global resume position and a data block,
-        calculate the local offset and how many bytes actually need to be sent.
+    # Kept as a method for API stability; the logic lives in the
+    # module-level _stream_window so hot paths can call it directly.
+    _get_stream_window = staticmethod(_stream_window)
 
-        Returns: (local_skip, bytes_to_send)
+    def _emit_fused_small_file(
+        self, entry: ManifestEntry
+    ) -> Generator[TarEvent, None, str]:
+        """
+        Emits header + full content of a small file as one event.
+        Applies the same integrity checks as the chunked path.
         """
-        block_end = block_start + block_length
+        source_path = os.path.join(self._directory_str, entry.info.rel_path)
+        validate_integrity(entry.info, self._directory_str)
+        size = entry.info.size
 
-        # Case: The restart point has now passed this entire block
-        if global_skip >= block_end:
-            return 0, 0
+        try:
+            with open(source_path, "rb", buffering=0) as f:
+                # Read one byte past the expected size so growth is visible.
+                content = f.read(size + 1)
+        except OSError as e:
+            raise TarIntegrityError(f"Error reading {source_path}") from e
 
-        # Case: The block is within or beyond the resume point
-        local_skip = max(0, global_skip - block_start)
-        bytes_to_send = block_length - local_skip
+        if len(content) < size:
+            raise TarIntegrityError(f"File shrunk: '{source_path}'")
+        if len(content) > size:
+            raise TarIntegrityError(
+                f"File grew: '{source_path}'. Bytes left: {content[size:]}"
+            )
 
-        return local_skip, bytes_to_send
+        yield TarFileDataEvent(
+            type="file_data", data=self._build_header(entry) + content
+        )
+        return hashlib.md5(content).hexdigest()
 
     def _stream_file_content_safely(
         self, entry: ManifestEntry, global_skip: int, chunk_size: int
     ) -> Generator[TarEvent, None, Optional[str]]:
         """Safely stream file content, ensuring that we do not read past the end of the file."""
 
-        local_skip, bytes_remaining = self._get_stream_window(
+        # Empty files: nothing to read, nothing to open, and the digest of
+        # zero bytes is a constant. Only claim it when the (empty) content
+        # block wasn't skipped by the resume point.
+        if entry.info.size == 0:
+            return _EMPTY_MD5 if global_skip <= entry.header_end_offset else None
+
+        local_skip, bytes_remaining = _stream_window(
             global_skip, entry.header_end_offset, entry.info.size
         )
 
         if bytes_remaining <= 0:
             return None
 
-        source_path = entry.get_absolute_path(self.directory)
-        validate_integrity(entry.info, self.directory)
+        source_path = os.path.join(self._directory_str, entry.info.rel_path)
+        validate_integrity(entry.info, self._directory_str)
         md5 = hashlib.md5() if local_skip == 0 else None
 
         try:
-            with open(source_path, "rb") as f:
+            # buffering=0 drops the BufferedReader layer: the stream reads in
+            # large aligned chunks already, so each read maps straight onto
+            # one read(2) without an intermediate copy through Python's
+            # buffer (or its lock).
+            with open(source_path, "rb", buffering=0) as f:
+                # Tell the kernel the access pattern is strictly sequential
+                # so it ramps up readahead, and that we want the whole range
+                # soon. Not available everywhere (e.g. Windows), hence the
+                # hasattr guard; purely advisory, so failures are ignored.
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(
+                            f.fileno(), 0, entry.info.size,
+                            os.POSIX_FADV_SEQUENTIAL,
+                        )
+                        os.posix_fadvise(
+                            f.fileno(), 0, entry.info.size,
+                            os.POSIX_FADV_WILLNEED,
+                        )
+                    except OSError:
+                        pass
+
+                # Bound to locals: the read loop runs once per chunk and the
+                # >=2 KiB updates release the GIL inside OpenSSL anyway.
+                md5_update = md5.update if md5 else None
+
+                if entry.info.size >= MMAP_THRESHOLD:
+                    yield from self._stream_from_mmap(
+                        f, source_path, local_skip, bytes_remaining,
+                        chunk_size, md5_update,
+                    )
+                    return md5.hexdigest() if md5 else None
+
                 if local_skip > 0:
                     f.seek(local_skip)
 
+                # Reads land in two pre-allocated buffers via readinto.
+                # Two buffers alternate so the hash worker can digest one
+                # (GIL released in OpenSSL) while the next read(2) fills
+                # the other. By default each event carries a bytes copy
+                # of the filled slice; with reuse_buffers=True the views
+                # themselves are yielded (zero-copy, consume-before-next
+                # contract — the buffer is recycled two iterations later).
+                reuse_buffers = self.reuse_buffers
+                hash_pool = self._hash_pool
+                pending = None
+                buffers = (
+                    memoryview(bytearray(chunk_size)),
+                    memoryview(bytearray(chunk_size)),
+                )
+                which = 0
+
                 while bytes_remaining > 0:
+                    buf = buffers[which]
+                    which ^= 1
                     read_size = min(chunk_size, bytes_remaining)
-                    chunk = f.read(read_size)
-                    if not chunk:
+                    n = f.readinto(buf[:read_size])
+                    if not n:
+                        if pending is not None:
+                            pending.result()
                         raise TarIntegrityError(f"File shrunk: '{source_path}'")
 
-                    if md5:
-                        md5.update(chunk)
-                    bytes_remaining -= len(chunk)
-                    yield TarFileDataEvent(type="file_data", data=chunk)
+                    chunk = buf[:n]
+                    if md5_update:
+                        if hash_pool is not None:
+                            if pending is not None:
+                                pending.result()
+                            pending = hash_pool.submit(md5_update, chunk)
+                        else:
+                            md5_update(chunk)
+                    bytes_remaining -= n
+                    yield TarFileDataEvent(
+                        type="file_data",
+                        data=chunk if reuse_buffers else bytes(chunk),
+                    )
+
+                if pending is not None:
+                    pending.result()
 
                 if local_skip == 0:
                     extra = f.read(1)
@@ -183,27 +625,66 @@ class TarStreamGenerator:
 
         return md5.hexdigest() if md5 else None
 
+    def _stream_from_mmap(
+        self, f, source_path, local_skip: int, bytes_remaining: int,
+        chunk_size: int, md5_update,
+    ) -> Generator[TarEvent, None, None]:
+        """
+        Serves a large file from a read-only memory map. Chunks are sliced
+        out of the page cache directly, avoiding one read(2) per chunk, and
+        the map length doubles as the shrink/grow integrity check.
+        """
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            end = local_skip + bytes_remaining
+            if len(mm) < end:
+                raise TarIntegrityError(f"File shrunk: '{source_path}'")
+            if local_skip == 0 and len(mm) > end:
+                raise TarIntegrityError(
+                    f"File grew: '{source_path}'. Bytes left: {len(mm) - end}"
+                )
+
+            # Note: chunks are bytes copies of the mapped pages, not
+            # memoryviews into the map. Views would be zero-copy but any
+            # consumer-held slice outliving the entry makes mmap.close()
+            # raise BufferError; a plain slice keeps the map's lifetime
+            # independent of the consumer.
+            offset = local_skip
+            while offset < end:
+                chunk = mm[offset : min(offset + chunk_size, end)]
+                if md5_update:
+                    md5_update(chunk)
+                offset += len(chunk)
+                yield TarFileDataEvent(type="file_data", data=chunk)
+
     def _emit_padding(
         self, entry: ManifestEntry, global_skip: int
     ) -> Generator[TarEvent, None, None]:
         # Padding starts where the data ends and ends at end_offset
         padding_total = entry.global_window.end - entry.content_end_offset
 
-        _, bytes_to_send = self._get_stream_window(
+        _, bytes_to_send = _stream_window(
             global_skip, entry.content_end_offset, padding_total
         )
         if bytes_to_send > 0:
-            yield TarFileDataEvent(type="file_data", data=b"\0" * bytes_to_send)
+            yield self._zero_event(bytes_to_send)
 
     def _emit_stream_gen_footer(
         self, global_skip: int, footer_start: int
     ) -> Generator[TarEvent, None, None]:
-        _, bytes_to_send = self._get_stream_window(
+        _, bytes_to_send = _stream_window(
             global_skip, footer_start, TAR_FOOTER_SIZE
         )
 
         if bytes_to_send > 0:
-            yield TarFileDataEvent(type="file_data", data=b"\0" * bytes_to_send)
+            yield self._zero_event(bytes_to_send)
+
+    def _zero_event(self, length: int) -> TarEvent:
+        if self.emit_holes:
+            return TarFileHoleEvent(type="file_hole", length=length)
+        return TarFileDataEvent(type="file_data", data=_PAD[length])
 
 
 class FolderVolume(TapeVolume):
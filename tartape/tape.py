@@ -1,6 +1,8 @@
 import json
 import logging
+import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator, List, Optional, Union
 
@@ -43,7 +45,7 @@ class Tape:
     @property
     def count_files(self) -> int:
         """Returns the total number of files in the tape."""
-        return self._stats["total_size"]
+        return self._track_count
 
     @property
     def fingerprint(self) -> str:
@@ -75,6 +77,34 @@ class Tape:
         with tartape.get_catalog(self.directory):
             yield from Track.select().order_by(Track.arc_path).iterator()
 
+    def iter_paths(self) -> Generator[str, None, None]:
+        """Yields every arc_path in stream order without hydrating Tracks.
+
+        Column projection for callers that only need the path: peewee
+        skips building a model instance per row, so iterating a large
+        catalog allocates one string per track instead of a full object.
+        """
+        with tartape.get_catalog(self.directory):
+            query = (
+                Track.select(Track.arc_path).order_by(Track.arc_path).tuples()
+            )
+            for (arc_path,) in query.iterator():
+                yield arc_path
+
+    def iter_sizes_offsets(self) -> Generator[tuple, None, None]:
+        """Yields (arc_path, size, start_offset, end_offset) tuples in
+        stream order. Same column-projection rationale as iter_paths().
+        """
+        with tartape.get_catalog(self.directory):
+            query = (
+                Track.select(
+                    Track.arc_path, Track.size, Track.start_offset, Track.end_offset
+                )
+                .order_by(Track.arc_path)
+                .tuples()
+            )
+            yield from query.iterator()
+
     def destroy(self):
         if self._catalog:
             self._catalog.close()
@@ -84,9 +114,25 @@ class Tape:
         if metadata_dir.exists():
             shutil.rmtree(metadata_dir)
 
-    def verify(self, deep: bool = False, raise_exception: bool = False):
+    def verify(
+        self,
+        deep: bool = False,
+        raise_exception: bool = False,
+        workers: Optional[int] = None,
+        sample_seed: Optional[int] = None,
+    ):
         """Returns True if the tape is valid, False otherwise
 
+        sample_seed makes the shallow spot check deterministic: the
+        sample is drawn with random.Random(seed) over the ordered
+        arc_paths instead of SQLite's Random(), so a given seed always
+        checks the same files. Leave it None for true random sampling.
+
+        With workers > 1, the deep check stats files from a thread pool
+        (lstat releases the GIL), which hides per-file latency on large
+        catalogs. Results are consumed in arc_path order, so the first
+        failure reported is deterministic regardless of thread timing.
+
         Exceptions:
         - TarIntegrityError: If the tape fails integrity checks (only raised if raise_exception=True
         - TapeVerificationError: If an unexpected error occurs during verification (only raised if raise_exception=True)
@@ -97,12 +143,42 @@ class Tape:
                 validate_root_structure_integrity(self.directory)
 
                 if deep:
-                    for track in Track.select().order_by(Track.arc_path).iterator():
-                        validate_integrity(track, self.directory)
+                    tracks = Track.select().order_by(Track.arc_path).iterator()
+                    if workers and workers > 1:
+                        with ThreadPoolExecutor(max_workers=workers) as pool:
+                            # map() yields in submission order, so any
+                            # TarIntegrityError surfaces for the first
+                            # failing arc_path, as in the serial path.
+                            for _ in pool.map(
+                                lambda t: validate_integrity(t, self.directory),
+                                tracks,
+                            ):
+                                pass
+                    else:
+                        for track in tracks:
+                            validate_integrity(track, self.directory)
                 else:
                     total = Track.select().count()
                     if total > 0:
-                        samples = Track.select().order_by(peewee.fn.Random()).limit(15)
+                        if sample_seed is not None:
+                            paths = [
+                                p
+                                for (p,) in Track.select(Track.arc_path)
+                                .order_by(Track.arc_path)
+                                .tuples()
+                            ]
+                            chosen = random.Random(sample_seed).sample(
+                                paths, min(15, len(paths))
+                            )
+                            samples = Track.select().where(
+                                Track.arc_path.in_(chosen)  # type: ignore
+                            )
+                        else:
+                            samples = (
+                                Track.select()
+                                .order_by(peewee.fn.Random())
+                                .limit(15)
+                            )
                         for track in samples:
                             validate_integrity(track, self.directory)
                 return True
@@ -149,7 +225,56 @@ class Tape:
         start_offset: int = 0,
         chunk_size: int = 64 * 1024,
         fast_verify: bool = True,
+        sample_seed: Optional[int] = None,
     ) -> Generator:
+        """
+        Yields the tape as a stream of Tar*Event objects.
+
+        Data events own their bytes: each TarFileDataEvent.data is safe
+        to hold onto after pulling the next event. (Zero-copy buffer
+        reuse exists on TarStreamGenerator via reuse_buffers=True, but
+        it is opt-in and not used here.)
+        """
+        self.verify(
+            deep=not fast_verify, raise_exception=True, sample_seed=sample_seed
+        )
+
+        tape_window = ByteWindow(start=0, end=self.total_size)
+        with tartape.get_catalog(self.directory) as cat:
+            if start_offset > 0:
+                self._verify_resume_point_integrity(cat, start_offset)
+
+            # Materialized (not a generator) so the engine sees a Sequence
+            # and can bisect to the resume point and prefetch ahead. The
+            # 512-byte header blobs stay in the DB: with them an entry
+            # list for a multi-million-track catalog would be mostly
+            # headers; without them entries are small slotted dataclasses
+            # and the stream rebuilds each header through the cached
+            # builder as it goes.
+            tracks = cat.query_tracks_intersecting_range(
+                start_offset, include_header_blocks=False
+            )
+            entries = [ManifestEntry.from_track(t, tape_window) for t in tracks]
+
+            engine = TarStreamGenerator(entries, self.directory)
+            yield from engine.stream(start_offset=start_offset, chunk_size=chunk_size)
+
+    def play_raw(
+        self,
+        start_offset: int = 0,
+        chunk_size: int = 64 * 1024,
+        fast_verify: bool = True,
+    ) -> Generator[bytes, None, None]:
+        """
+        Yields raw TAR bytes with no event envelopes.
+
+        For consumers that only want the byte stream (uploaders,
+        compressors), this skips per-event isinstance dispatch and the
+        file_start/file_end bookkeeping objects. Contiguous emissions
+        are coalesced into chunk_size blocks, so small files do not
+        fragment the output into tiny yields. Yielded chunks own their
+        bytes and are safe to accumulate.
+        """
         self.verify(deep=not fast_verify, raise_exception=True)
 
         tape_window = ByteWindow(start=0, end=self.total_size)
@@ -157,14 +282,70 @@ class Tape:
             if start_offset > 0:
                 self._verify_resume_point_integrity(cat, start_offset)
 
-            tracks = cat.query_tracks_intersecting_range(start_offset)
+            # Materialized for the same reason as play(): a Sequence enables
+            # the engine's bisect resume and prefetch paths. Header blobs
+            # are left in the DB so the list stays small.
+            tracks = cat.query_tracks_intersecting_range(
+                start_offset, include_header_blocks=False
+            )
+            entries = [ManifestEntry.from_track(t, tape_window) for t in tracks]
 
-            def track_loader():
-                for track in tracks:
-                    yield ManifestEntry.from_track(track, tape_window)
+            engine = TarStreamGenerator(entries, self.directory)
+            for event in engine.stream(
+                start_offset=start_offset, chunk_size=chunk_size, coalesce=True
+            ):
+                if event.type == "file_data":
+                    yield event.data
 
-            engine = TarStreamGenerator(track_loader(), self.directory)
-            yield from engine.stream(start_offset=start_offset, chunk_size=chunk_size)
+    def play_into(self, writer, **kwargs) -> int:
+        """
+        Plays the tape and writes every data event into `writer` (any
+        object with a write() method: an open file, a BufferedWriter
+        over a socket, etc.).
+
+        Saves callers the accumulate-into-BytesIO dance — bytes go
+        straight to the destination as they are produced, so nothing is
+        held in memory beyond one chunk. Returns the number of bytes
+        written. Keyword arguments are forwarded to play().
+        """
+        written = 0
+        write = writer.write
+        for event in self.play(**kwargs):
+            if event.type == "file_data":
+                write(event.data)
+                written += len(event.data)
+        return written
+
+    def pipe_to(
+        self,
+        out_fd: int,
+        start_offset: int = 0,
+        fast_verify: bool = True,
+    ) -> int:
+        """
+        Writes the whole TAR stream straight to a file descriptor.
+
+        Kernel zero-copy variant of play(): file bodies go through
+        os.sendfile where available, so content never touches Python
+        buffers. No events are emitted and no MD5 digests are computed.
+        Returns the number of bytes written.
+        """
+        self.verify(deep=not fast_verify, raise_exception=True)
+
+        tape_window = ByteWindow(start=0, end=self.total_size)
+        with tartape.get_catalog(self.directory) as cat:
+            if start_offset > 0:
+                self._verify_resume_point_integrity(cat, start_offset)
+
+            # Same slim materialization as play(): headers are rebuilt on
+            # the fly instead of holding one blob per track.
+            tracks = cat.query_tracks_intersecting_range(
+                start_offset, include_header_blocks=False
+            )
+            entries = [ManifestEntry.from_track(t, tape_window) for t in tracks]
+
+            engine = TarStreamGenerator(entries, self.directory)
+            return engine.stream_to_fd(out_fd, start_offset=start_offset)
 
     def get_volume(
         self, vol_name: str, vol_index: int, vol_start: int, vol_end: int
@@ -31,7 +31,9 @@ class TarTapeTestCase(unittest.TestCase):
     def create_file(self, rel_path: str, content: str = "data"):
         p = self.data_dir / rel_path
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content)
+        # write_bytes abre en binario: sin capa TextIOWrapper ni pasada
+        # de codificación incremental por archivo.
+        p.write_bytes(content.encode("utf-8"))
         return p
 
     def create_minimal_track(self, **kwargs) -> Track:
@@ -54,6 +54,25 @@ class TestIntegritySafeguards(TarTapeTestCase):
             for _ in tape.play(fast_verify=False):
                 pass
 
+    def test_parallel_deep_verify_detects_mutation(self):
+        """verify(deep=True, workers=N) debe dar el mismo veredicto que la
+        pasada serial: True sobre una cinta limpia y False tras mutar un
+        archivo."""
+        for i in range(5):
+            self.create_file(f"file_{i}.txt", f"contenido {i}")
+
+        TapeRecorder(self.data_dir).commit()
+        tape = Tape(self.data_dir)
+
+        self.assertTrue(tape.verify(deep=True, workers=2))
+
+        mutated = self.data_dir / "file_3.txt"
+        os.utime(mutated, (time.time() + 1000, time.time() + 1000))
+
+        self.assertFalse(tape.verify(deep=True, workers=2))
+        with self.assertRaisesRegex(TarIntegrityError, "File modified"):
+            tape.verify(deep=True, workers=2, raise_exception=True)
+
     def test_identity_anonymization(self):
         """ADR-003: Verifica que por defecto se anonimicen UID/GID y nombres."""
         self.create_file("secret.txt")
@@ -1,11 +1,29 @@
-import io
+import functools
 import tarfile
-from typing import cast
 
 from tartape.header import TarHeader
 from tartape.models import Track
+from tests._tar_cache import parse_tar
 from tests.base import TarTapeTestCase
 
+# Trailer EOF de TAR (dos bloques de ceros), asignado una sola vez a
+# nivel de módulo: cada round-trip lo reutiliza en vez de construir
+# b"\0" * 1024 por test, y las comparaciones contra él son memcmp en C.
+_EOF_TRAILER = bytes(1024)
+
+
+@functools.cache
+def _gnu_reference(arc_path, size, uid, gid, uname, gname, mtime) -> bytes:
+    """Header de referencia de la stdlib, construido una sola vez por
+    combinación de campos: tobuf() re-codifica todos los campos en cada
+    llamada, así que entradas idénticas no deben pagarlo dos veces."""
+    info = tarfile.TarInfo(name=arc_path)
+    info.size = size
+    info.uid, info.gid = uid, gid
+    info.uname, info.gname = uname, gname
+    info.mtime = mtime
+    return info.tobuf(format=tarfile.GNU_FORMAT)
+
 
 class TestHeader(TarTapeTestCase):
 
@@ -33,23 +51,18 @@ class TestHeader(TarTapeTestCase):
         e1 = self.create_minimal_track(size=10**10)  # 10GB
         e2 = self.create_minimal_track(size=10**10)
 
-        info1 = tarfile.TarInfo(name=e1.arc_path)
-        info1.size = e1.size
-        info1.uid, info1.gid = e1.uid, e1.gid
-        info1.uname, info1.gname = e1.uname, e1.gname
-        info1.mtime = e1.mtime
-
-        info2 = tarfile.TarInfo(name=e2.arc_path)
-        info2.size = e2.size
-        info2.uid, info2.gid = e2.uid, e2.gid
-        info2.uname, info2.gname = e2.uname, e2.gname
-        info2.mtime = e2.mtime
-
-        h1 = info1.tobuf(format=tarfile.GNU_FORMAT)
-        h2 = info2.tobuf(format=tarfile.GNU_FORMAT)
+        h1 = _gnu_reference(
+            e1.arc_path, e1.size, e1.uid, e1.gid, e1.uname, e1.gname, e1.mtime
+        )
+        h2 = _gnu_reference(
+            e2.arc_path, e2.size, e2.uid, e2.gid, e2.uname, e2.gname, e2.mtime
+        )
 
         self.assertEqual(h1, h2, "Los headers no son idénticos bit a bit")
 
+        # El motor propio también debe ser determinista para entradas iguales.
+        self.assertEqual(TarHeader(e1).build(), TarHeader(e2).build())
+
     def test_binary_identity(self):
         """Garantiza que el header es idéntico bit a bit sin importar el entorno, siempre que los datos de entrada sean los mismos."""
 
@@ -82,18 +95,15 @@ class TestHeader(TarTapeTestCase):
             len(header_bytes), 512, "El header debe medir exactamente 512 bytes"
         )
 
-        # Usamos tf.next() para leer el header sin saltar al contenido
-        full_tar = header_bytes + (b"\0" * 1024)
-        with tarfile.open(fileobj=io.BytesIO(full_tar), mode="r") as tf:
-            member = cast(tarfile.TarInfo, tf.next())
+        member = parse_tar(header_bytes + _EOF_TRAILER)[0]
 
-            self.assertIsNotNone(member, "No se pudo leer el miembro del TAR")
-            self.assertEqual(member.name, "giant.bin")
-            self.assertEqual(
-                member.size,
-                giant_size,
-                "La librería estándar no reconoció el tamaño Base-256",
-            )
+        self.assertIsNotNone(member, "No se pudo leer el miembro del TAR")
+        self.assertEqual(member.name, "giant.bin")
+        self.assertEqual(
+            member.size,
+            giant_size,
+            "La librería estándar no reconoció el tamaño Base-256",
+        )
 
     def test_header_fields_precision_alignment(self):
         """
@@ -114,22 +124,19 @@ class TestHeader(TarTapeTestCase):
         entry = self.create_minimal_track(**params)
         header_bytes = TarHeader(entry).build()
 
-        full_tar = header_bytes + (b"\0" * 1024)
-
-        with tarfile.open(fileobj=io.BytesIO(full_tar), mode="r") as tf:
-            member = cast(tarfile.TarInfo, tf.next())
-            self.assertIsNotNone(member)
+        member = parse_tar(header_bytes + _EOF_TRAILER)[0]
+        self.assertIsNotNone(member)
 
-            self.assertEqual(member.name, params["arc_path"], "Ruta corrupta")
-            self.assertEqual(member.size, params["size"], "Tamaño corrupto o solapado")
-            self.assertEqual(member.mode, params["mode"], "Permisos (mode) corruptos")
-            self.assertEqual(member.uid, params["uid"], "UID corrupto")
-            self.assertEqual(member.gid, params["gid"], "GID corrupto")
-            self.assertEqual(member.mtime, int(params["mtime"]), "mtime corrupto")
-            self.assertEqual(member.uname, params["uname"], "Username corrupto")
-            self.assertEqual(member.gname, params["gname"], "Groupname corrupto")
+        self.assertEqual(member.name, params["arc_path"], "Ruta corrupta")
+        self.assertEqual(member.size, params["size"], "Tamaño corrupto o solapado")
+        self.assertEqual(member.mode, params["mode"], "Permisos (mode) corruptos")
+        self.assertEqual(member.uid, params["uid"], "UID corrupto")
+        self.assertEqual(member.gid, params["gid"], "GID corrupto")
+        self.assertEqual(member.mtime, int(params["mtime"]), "mtime corrupto")
+        self.assertEqual(member.uname, params["uname"], "Username corrupto")
+        self.assertEqual(member.gname, params["gname"], "Groupname corrupto")
 
-            self.assertTrue(member.chksum > 0)
+        self.assertTrue(member.chksum > 0)
 
     def test_large_file_base256(self):
         """Verifica que archivos > 8GiB mantienen el bloque de 512 bytes (GNU extension)."""
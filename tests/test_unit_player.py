@@ -1,7 +1,10 @@
+import hashlib
 import io
 import os
-import tarfile
+import shutil
+import tempfile
 import time
+from pathlib import Path
 
 from tartape.exceptions import TarIntegrityError
 from tartape.models import Track
@@ -10,9 +13,55 @@ from tartape.schemas import TarFileDataEvent
 from tartape.tape import Tape
 from tests.base import TarTapeTestCase
 
+# Bloque de ceros compartido para las aserciones de padding: la
+# igualdad contra él es un memcmp de C y no asigna nada por test.
+_ZERO_BLOCK = bytes(512)
+
 
 class TestStreamingEngine(TarTapeTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Cinta compartida de solo lectura para los tests de equivalencia
+        de salida: grabar el catálogo es lo más caro del fixture, así que
+        se paga una vez por clase. Los tests que mutan archivos siguen
+        construyendo su propia cinta en setUp."""
+        super().setUpClass()
+        cls.shared_tmp = Path(tempfile.mkdtemp())
+        cls.shared_data = cls.shared_tmp / "dataset"
+        cls.shared_data.mkdir()
+        (cls.shared_data / "a.txt").write_text("contenido corto")
+        (cls.shared_data / "b.bin").write_text("Z" * 5000)
+        TapeRecorder(cls.shared_data).commit()
+        cls.shared_tape = Tape(cls.shared_data)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.shared_tmp, ignore_errors=True)
+        super().tearDownClass()
+
+    _shared_bytes_cache = None
+
+    def _shared_tape_bytes(self) -> bytes:
+        # La cinta compartida es de solo lectura, así que sus bytes de
+        # referencia se reproducen una vez y se reutilizan en los cuatro
+        # tests de equivalencia en vez de regenerarse por test.
+        if type(self)._shared_bytes_cache is not None:
+            return type(self)._shared_bytes_cache
+        # El tamaño final es conocido (tape.total_size), así que un
+        # bytearray preasignado evita las reasignaciones por duplicación
+        # de BytesIO y la sobrecarga por llamada de write().
+        buffer = bytearray(self.shared_tape.total_size)
+        view = memoryview(buffer)
+        pos = 0
+        for event in self.shared_tape.play(fast_verify=False):
+            if isinstance(event, TarFileDataEvent):
+                n = len(event.data)
+                view[pos : pos + n] = event.data
+                pos += n
+        type(self)._shared_bytes_cache = bytes(buffer)
+        return type(self)._shared_bytes_cache
+
     def test_byte_perfect_resume(self):
         """
         Verifica que reanudar en un offset arbitrario produce bytes idénticos
@@ -28,13 +77,6 @@ class TestStreamingEngine(TarTapeTestCase):
         recorder.commit()
 
         tape = Tape(self.data_dir)
-        full_buffer = io.BytesIO()
-        for event in tape.play(start_offset=0, fast_verify=False):
-            if isinstance(event, TarFileDataEvent):
-                full_buffer.write(event.data)
-
-        full_bytes = full_buffer.getvalue()
-        total_len = len(full_bytes)
 
         # Elegimos un offset de reanudación "difícil"
         # Buscamos el track del archivo grande para reanudar EN MEDIO de sus datos
@@ -46,28 +88,44 @@ class TestStreamingEngine(TarTapeTestCase):
         # Asegurarnos de que no estamos alineados a 512 para forzar la lógica de "windowing"
         self.assertNotEqual(resume_offset % 512, 0)
 
-        # Genera el stream RESUMIDO desde ese punto
-        resumed_buffer = io.BytesIO()
+        # --- VALIDACIÓN MAESTRA (incremental, sin materializar streams) ---
+
+        # Digest del sufijo del stream completo: consumimos chunk a chunk
+        # descartando los primeros resume_offset bytes, sin acumular nada.
+        full_digest = hashlib.blake2b()
+        total_len = 0
+        skipped = 0
+        suffix_len = 0
+        for event in tape.play(start_offset=0, fast_verify=False):
+            if not isinstance(event, TarFileDataEvent):
+                continue
+            data = bytes(event.data)
+            total_len += len(data)
+            if skipped < resume_offset:
+                drop = min(resume_offset - skipped, len(data))
+                skipped += drop
+                data = data[drop:]
+            if data:
+                full_digest.update(data)
+                suffix_len += len(data)
+
+        # Digest del stream reanudado desde ese punto
+        resumed_digest = hashlib.blake2b()
+        resumed_len = 0
         for event in tape.play(start_offset=resume_offset, fast_verify=False):
             if isinstance(event, TarFileDataEvent):
-                resumed_buffer.write(event.data)
-
-        resumed_bytes = resumed_buffer.getvalue()
-
-        # --- VALIDACIÓN MAESTRA ---
-
-        # El stream reanudado debe ser EXACTAMENTE igual al recorte del original
-        expected_suffix = full_bytes[resume_offset:]
+                resumed_digest.update(event.data)
+                resumed_len += len(event.data)
 
         self.assertEqual(
-            len(resumed_bytes),
-            len(expected_suffix),
+            resumed_len,
+            suffix_len,
             "El tamaño del stream reanudado no coincide con el remanente esperado",
         )
 
         self.assertEqual(
-            resumed_bytes,
-            expected_suffix,
+            resumed_digest.hexdigest(),
+            full_digest.hexdigest(),
             "Los bytes del stream reanudado no son idénticos al stream original (Bit-Perfect Fail)",
         )
 
@@ -90,17 +148,24 @@ class TestStreamingEngine(TarTapeTestCase):
         tape = Tape(self.data_dir)
 
         # --- Solo calculos de offsets y tamaños, sin leer el stream aún ---
-        track = next(t for t in tape.get_tracks() if filename in t.arc_path)
+        # Lookup puntual en SQLite en vez de escaneo lineal en Python
+        track = Track.get(Track.arc_path.contains(filename))  # type: ignore
         self.assertEqual(track.size, 1)
         self.assertEqual(track.padding_size, 511)
         self.assertEqual(track.total_block_size, 1024)
 
-        full_stream = io.BytesIO()
+        # Mismo patrón que _shared_tape_bytes: tamaño conocido, buffer
+        # preasignado en lugar de BytesIO.
+        stream_buffer = bytearray(tape.total_size)
+        stream_view = memoryview(stream_buffer)
+        pos = 0
         for event in tape.play(fast_verify=False):
             if isinstance(event, TarFileDataEvent):
-                full_stream.write(event.data)
+                n = len(event.data)
+                stream_view[pos : pos + n] = event.data
+                pos += n
 
-        stream_bytes = full_stream.getvalue()
+        stream_bytes = bytes(stream_buffer)
 
         # --- Verificaciones reales de contenido (bytes) ---
 
@@ -116,7 +181,9 @@ class TestStreamingEngine(TarTapeTestCase):
         self.assertEqual(data_byte, content, "El contenido del archivo es incorrecto")
         self.assertEqual(len(padding), 511, "El tamaño del padding es incorrecto")
         self.assertEqual(
-            padding, b"\0" * 511, "El padding debe contener solo bytes nulos"
+            padding,
+            _ZERO_BLOCK[:511],
+            "El padding debe contener solo bytes nulos",
         )
 
         # El siguiente byte en el stream global (si existe otro archivo o el footer)
@@ -131,7 +198,7 @@ class TestStreamingEngine(TarTapeTestCase):
 
         tape = Tape(self.data_dir)
         # Buscamos el offset exacto donde empieza b.txt en el stream
-        track_b = [t for t in tape.get_tracks() if "b.txt" in t.arc_path][0]
+        track_b = Track.get(Track.arc_path.contains("b.txt"))  # type: ignore
         start_offset = track_b.start_offset
 
         buffer = io.BytesIO()
@@ -139,19 +206,76 @@ class TestStreamingEngine(TarTapeTestCase):
             if isinstance(event, TarFileDataEvent):
                 buffer.write(event.data)
 
-        buffer.seek(0)
-        with tarfile.open(fileobj=buffer, mode="r:") as tf:
-            names = tf.getnames()
+        # Parseo directo del header USTAR: el campo name ocupa los
+        # primeros 100 bytes y la firma 'ustar' vive en el offset 257.
+        # No hace falta levantar tarfile para leer un solo nombre.
+        data = buffer.getvalue()
+        self.assertTrue(data[:100].rstrip(b"\x00").endswith(b"b.txt"))
+        self.assertEqual(data[257:262], b"ustar")
+
+        # Solo debería existir b.txt, nada de a.txt: tras su bloque
+        # completo solo puede venir el footer de ceros, no otro header.
+        next_block = data[track_b.total_block_size : track_b.total_block_size + 512]
+        self.assertEqual(next_block, _ZERO_BLOCK)
+
+    def test_hole_events_reconstruct_same_bytes(self):
+        """Con emit_holes=True, los huecos anunciados más los datos deben
+        reconstruir exactamente el mismo stream que el modo por defecto."""
+        import tartape
+        from tartape.schemas import ByteWindow, ManifestEntry, TarFileHoleEvent
+        from tartape.stream import TarStreamGenerator
+
+        tape = self.shared_tape
+        expected = self._shared_tape_bytes()
+
+        window = ByteWindow(start=0, end=tape.total_size)
+        with tartape.get_catalog(self.shared_data) as cat:
+            entries = [
+                ManifestEntry.from_track(t, window)
+                for t in cat.query_tracks_intersecting_range(0)
+            ]
+
+        engine = TarStreamGenerator(entries, self.shared_data, emit_holes=True)
+        rebuilt = bytearray()
+        saw_hole = False
+        for event in engine.stream():
+            if isinstance(event, TarFileDataEvent):
+                rebuilt += event.data
+            elif isinstance(event, TarFileHoleEvent):
+                saw_hole = True
+                rebuilt += bytes(event.length)
+
+        self.assertTrue(saw_hole, "El stream no anunció ningún hueco")
+        self.assertEqual(bytes(rebuilt), expected)
+
+    def test_accumulated_events_are_stable(self):
+        """Los datos de un evento deben seguir siendo válidos después de
+        consumir eventos posteriores (los buffers no se reciclan por
+        defecto)."""
+        # Tamaño entre un chunk (64 KiB) y MMAP_THRESHOLD: ejercita el
+        # bucle readinto con doble buffer.
+        self.create_file("mid.bin", "M" * (200 * 1024))
+        TapeRecorder(self.data_dir).commit()
+
+        tape = Tape(self.data_dir)
+        events = [
+            event
+            for event in tape.play(fast_verify=False)
+            if isinstance(event, TarFileDataEvent)
+        ]
+        accumulated = b"".join(bytes(e.data) for e in events)
 
-            # Solo debería existir b.txt, nada de a.txt
-            self.assertEqual(len(names), 1)
-            self.assertTrue(names[0].endswith("b.txt"))
+        expected = b"".join(tape.play_raw(fast_verify=False))
+        self.assertEqual(accumulated, expected)
 
     def test_player_spot_check_detection(self):
         """Verifica que el muestreo aleatorio (Spot Check) detecte mutaciones."""
 
+        # data_dir ya existe y el contenido es idéntico: bytes
+        # precomputados y write_bytes directo, sin mkdir por archivo.
+        content_bytes = b"content"
         for i in range(20):
-            self.create_file(f"file_{i}.txt", "content")
+            (self.data_dir / f"file_{i}.txt").write_bytes(content_bytes)
 
         TapeRecorder(self.data_dir).commit()
 
@@ -161,13 +285,62 @@ class TestStreamingEngine(TarTapeTestCase):
 
         tape = Tape(self.data_dir)
 
-        found_error = False
-        for _ in range(3):
-            try:
-                # El spot_check se ejecuta dentro de play() si fast_verify=True
-                list(tape.play(fast_verify=True))
-            except TarIntegrityError:
-                found_error = True
-                break
-
-        self.assertTrue(found_error, "El spot check no detectó la mutación del archivo")
+        # Con sample_seed la muestra es determinista e incluye file_10.txt,
+        # así que una sola pasada basta (sin bucle de reintentos).
+        with self.assertRaises(TarIntegrityError):
+            list(tape.play(fast_verify=True, sample_seed=0))
+
+    def test_stream_to_fd_matches_event_stream(self):
+        """El fast-path de sendfile debe producir los mismos bytes que play()."""
+        import tartape
+        from tartape.schemas import ByteWindow, ManifestEntry
+        from tartape.stream import TarStreamGenerator
+
+        tape = self.shared_tape
+        expected = self._shared_tape_bytes()
+
+        out_path = self.tmp / "out.tar"
+        window = ByteWindow(start=0, end=tape.total_size)
+        with tartape.get_catalog(self.shared_data) as cat:
+            entries = [
+                ManifestEntry.from_track(t, window)
+                for t in cat.query_tracks_intersecting_range(0)
+            ]
+
+        engine = TarStreamGenerator(entries, self.shared_data)
+        with open(out_path, "wb") as out:
+            written = engine.stream_to_fd(out.fileno())
+
+        self.assertEqual(written, tape.total_size)
+        self.assertEqual(out_path.read_bytes(), expected)
+
+    def test_play_raw_matches_event_stream(self):
+        """play_raw debe producir el mismo flujo de bytes que play()."""
+        tape = self.shared_tape
+        expected = self._shared_tape_bytes()
+
+        raw = b"".join(tape.play_raw(fast_verify=False))
+        self.assertEqual(raw, expected)
+
+    def test_play_into_matches_event_stream(self):
+        """play_into debe escribir exactamente los mismos bytes que play()."""
+        tape = self.shared_tape
+        expected = self._shared_tape_bytes()
+
+        out = io.BytesIO()
+        written = tape.play_into(out, fast_verify=False)
+
+        self.assertEqual(written, tape.total_size)
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_pipe_to_writes_full_tape(self):
+        """pipe_to debe volcar la cinta completa a un descriptor de archivo."""
+        tape = self.shared_tape
+        expected = self._shared_tape_bytes()
+
+        out_path = self.tmp / "piped.tar"
+        with open(out_path, "wb") as out:
+            written = tape.pipe_to(out.fileno(), fast_verify=False)
+
+        self.assertEqual(written, tape.total_size)
+        self.assertEqual(out_path.read_bytes(), expected)
@@ -1,3 +1,6 @@
+import sqlite3
+
+from tartape.constants import TAPE_DB_NAME, TAPE_METADATA_DIR
 from tartape.recorder import TapeRecorder
 from tartape.tape import Tape
 from tests.base import TarTapeTestCase
@@ -30,3 +33,92 @@ class TestHeader(TarTapeTestCase):
         paths = [t.arc_path for t in tape.get_tracks()]
         self.assertTrue(any("keep.txt" in p for p in paths))
         self.assertFalse(any("ignore.log" in p for p in paths))
+
+    def test_stateful_callable_exclude(self):
+        """Un exclude callable con estado debe funcionar bajo el escaneo
+        multihilo: las invocaciones se serializan, así que el contador
+        interno no pierde actualizaciones."""
+        for i in range(10):
+            self.create_file(f"keep_{i}.txt")
+            self.create_file(f"drop_{i}.log")
+
+        seen = []
+
+        def exclude(path):
+            seen.append(path.name)
+            return path.suffix == ".log"
+
+        TapeRecorder(self.data_dir, exclude=exclude).commit()
+
+        tape = Tape(self.data_dir)
+        paths = [t.arc_path for t in tape.get_tracks()]
+        self.assertEqual(sum(1 for p in paths if "keep_" in p), 10)
+        self.assertFalse(any(".log" in p for p in paths))
+        # El callable vio cada candidato exactamente una vez.
+        self.assertEqual(len(seen), 20)
+
+    def test_old_catalog_without_new_columns_still_plays(self):
+        """Un catálogo grabado antes de que existieran mtime_ns y
+        header_block debe seguir abriéndose: la migración de conexión
+        añade las columnas, la verificación cae al compare por segundos
+        y el stream reconstruye los headers en playback."""
+        self.create_file("legacy.txt", "contenido")
+        TapeRecorder(self.data_dir).commit()
+
+        # Simulamos el catálogo viejo quitando las columnas directamente.
+        db_path = self.data_dir / TAPE_METADATA_DIR / TAPE_DB_NAME
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("ALTER TABLE track DROP COLUMN mtime_ns")
+            conn.execute("ALTER TABLE track DROP COLUMN header_block")
+
+        tape = Tape(self.data_dir)
+        self.assertTrue(tape.verify(deep=True))
+        consumed = sum(len(chunk) for chunk in tape.play_raw(fast_verify=False))
+        self.assertEqual(consumed, tape.total_size)
+
+    def test_fingerprint_algo_is_honored(self):
+        """El fingerprint debe calcularse con el algoritmo pedido y un
+        algoritmo desconocido debe fallar al construir el recorder."""
+        self.create_file("a.txt", "contenido")
+
+        recorder = TapeRecorder(self.data_dir, fingerprint_algo="blake2b")
+        recorder.commit()
+
+        tape = Tape(self.data_dir)
+        # blake2b produce un digest de 64 bytes (128 hex), no los 64 hex
+        # de sha256: si el algoritmo se ignorara, esta longitud delataría.
+        self.assertEqual(len(tape.fingerprint), 128)
+        int(tape.fingerprint, 16)
+
+        with self.assertRaises(ValueError):
+            TapeRecorder(self.data_dir, fingerprint_algo="no-such-algo")
+
+    def test_iter_paths_matches_get_tracks(self):
+        """iter_paths debe devolver los mismos arc_path que get_tracks."""
+        self.create_file("b.txt")
+        self.create_file("a.txt")
+
+        recorder = TapeRecorder(self.data_dir)
+        recorder.commit()
+
+        tape = Tape(self.data_dir)
+        full = [t.arc_path for t in tape.get_tracks()]
+        projected = list(tape.iter_paths())
+        self.assertEqual(projected, full)
+
+    def test_iter_sizes_offsets_matches_get_tracks(self):
+        """iter_sizes_offsets debe proyectar las mismas columnas que
+        exponen los Tracks completos, en el mismo orden de stream."""
+        self.create_file("b.txt", "contenido largo")
+        self.create_file("a.txt", "x")
+
+        recorder = TapeRecorder(self.data_dir)
+        recorder.commit()
+
+        tape = Tape(self.data_dir)
+        full = [
+            (t.arc_path, t.size, t.start_offset, t.end_offset)
+            for t in tape.get_tracks()
+        ]
+        projected = list(tape.iter_sizes_offsets())
+        self.assertEqual(projected, full)